@@ -0,0 +1,175 @@
+"""
+Shared pytest configuration for the question generation test suite.
+
+Guards against PyYAML silently falling back to its pure-Python parser,
+which is 10-100x slower than the libyaml C extension and easy to miss,
+and hosts the read-only fixtures shared across test modules.
+"""
+
+import os
+import warnings
+
+import pytest
+import yaml
+
+if getattr(yaml, "CSafeLoader", None) is None:
+    if os.environ.get("CI"):
+        raise RuntimeError(
+            "libyaml C extension missing; install libyaml-dev and "
+            "reinstall PyYAML"
+        )
+    warnings.warn(
+        "PyYAML is running without the libyaml C extension; "
+        "the test suite will be significantly slower",
+        RuntimeWarning
+    )
+
+
+# ---------------------------------------------------------------------------
+# Shared read-only fixtures
+#
+# These are session-scoped because no test mutates the returned objects;
+# building them once avoids repeated Pydantic validation in every test.
+# Imports are local so collecting unrelated modules stays cheap.
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def config():
+    """Create test configuration."""
+    from config.agent_config import AgentConfig, BedrockConfig, MCPConfig
+
+    return AgentConfig(
+        bedrock=BedrockConfig(
+            model_id="anthropic.claude-3-5-sonnet-20241022-v2:0",
+            region_name="us-west-2",
+            temperature=0.3,
+            max_tokens=4000
+        ),
+        mcp=MCPConfig(
+            server_name="aws-docs-test",
+            connection_timeout=10
+        ),
+        debug_mode=True
+    )
+
+
+@pytest.fixture(scope="session")
+def agent_config():
+    """Create a default AgentConfig shared by the setup tests."""
+    from config.agent_config import AgentConfig
+
+    return AgentConfig()
+
+
+@pytest.fixture(scope="session")
+def sample_batch_plan():
+    """Create sample batch plan for testing."""
+    from models.batch_models import BatchPlan
+
+    return BatchPlan(
+        batch_number=1,
+        target_domain="monitoring",
+        target_difficulties=["medium"],
+        priority_topics=["CloudWatch monitoring", "CloudWatch alarms"],
+        research_queries=["CloudWatch best practices"],
+        question_types={"scenario": 2, "technical": 2, "best_practices": 1, "troubleshooting": 1},
+        priority_services=["CloudWatch", "SNS"],
+        complexity_focus="practical",
+        avoid_topics=["Basic monitoring"],
+        estimated_completion_time=10
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_aws_content():
+    """Create sample AWS knowledge content."""
+    return """
+# Amazon CloudWatch Best Practices
+
+## Monitoring Strategy
+- Use custom metrics for application-specific monitoring
+- Set up appropriate alarm thresholds based on historical data
+- Implement composite alarms for complex scenarios
+
+## Cost Optimization
+- Use metric filters to reduce log ingestion costs
+- Set appropriate retention periods for logs
+
+## Security Considerations
+- Use IAM roles for CloudWatch access
+- Enable CloudTrail for API logging
+"""
+
+
+@pytest.fixture(scope="session")
+def mock_question_factory():
+    """Factory for lightweight mock questions used by mocked generation tests.
+
+    The shared template is built once with model_construct - the mock
+    data is deliberately shorter than the real-question validators allow
+    - and each clone only overrides the varied fields, skipping the
+    Pydantic validation pipeline entirely.
+    """
+    from models.question_models import Question, LearningResource
+
+    base = Question.model_construct(
+        id="q000",
+        domain="monitoring",
+        difficulty="medium",
+        type="single",
+        question="Test question",
+        options=["A", "B", "C", "D"],
+        correct_answer="A",
+        explanation="Test explanation",
+        learning_resources=[
+            LearningResource.model_construct(
+                title="Test Resource",
+                url="https://example.com",
+                type="documentation"
+            )
+        ],
+        related_services=["CloudWatch"],
+        tags=["monitoring"]
+    )
+
+    def make(index=None, **overrides):
+        if index is not None:
+            overrides.setdefault("id", f"q{index+1:03d}")
+            overrides.setdefault("question", f"Test question {index+1}")
+            overrides.setdefault("explanation", f"Test explanation {index+1}")
+        return base.model_copy(update=overrides)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def sample_question(mock_question_factory):
+    """Create sample question for testing.
+
+    Built through the factory's model_construct template: the realistic
+    Japanese sample text is shorter than the production length
+    validators require, and skipping validation keeps the fixture cheap.
+    """
+    from models.question_models import LearningResource
+
+    return mock_question_factory(
+        id="q001",
+        question="CloudWatchでカスタムメトリクスを効率的に監視するための最適な方法は何ですか？",
+        options=[
+            "すべてのメトリクスを1分間隔で収集する",
+            "アプリケーション固有のメトリクスを定義し、適切な間隔で収集する",
+            "デフォルトメトリクスのみを使用する",
+            "すべてのメトリクスを詳細監視で設定する"
+        ],
+        correct_answer="B",
+        explanation="アプリケーション固有のカスタムメトリクスを定義し、適切な収集間隔を設定することで、効率的で費用対効果の高い監視が実現できます。",
+        learning_resources=[
+            LearningResource.model_construct(
+                title="CloudWatch Custom Metrics",
+                url="https://docs.aws.amazon.com/cloudwatch/latest/monitoring/publishingMetrics.html",
+                type="documentation"
+            )
+        ],
+        related_services=["CloudWatch", "EC2"],
+        tags=["monitoring", "custom-metrics"]
+    )
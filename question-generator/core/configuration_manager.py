@@ -10,7 +10,7 @@ import json
 import yaml
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union, Tuple
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from datetime import datetime
 import logging
 from enum import Enum
@@ -21,6 +21,10 @@ from pydantic import BaseModel, Field, validator
 # Local imports
 from config import AgentConfig, BedrockConfig, MCPConfig
 
+# Prefer the libyaml C emitter when available; fall back to the pure-Python
+# SafeDumper otherwise.
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class LogLevel(Enum):
     """Available logging levels."""
@@ -48,7 +52,7 @@ class BatchStrategy(Enum):
     PRIORITY = "priority"           # Process high-priority batches first
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainConfiguration:
     """Configuration for individual exam domains."""
     name: str
@@ -66,7 +70,7 @@ class DomainConfiguration:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchConfiguration:
     """Configuration for batch processing."""
     batch_size: int = 10
@@ -81,7 +85,7 @@ class BatchConfiguration:
     checkpoint_frequency: int = 1  # Save state every N batches
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfiguration:
     """Configuration for individual AI agents."""
     enabled: bool = True
@@ -93,7 +97,7 @@ class AgentConfiguration:
     model_overrides: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityConfiguration:
     """Configuration for quality validation."""
     min_technical_accuracy: float = 8.0
@@ -106,7 +110,7 @@ class QualityConfiguration:
     validate_aws_services: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseConfiguration:
     """Configuration for database operations."""
     database_path: str = "output/questions.json"
@@ -118,7 +122,7 @@ class DatabaseConfiguration:
     compression_enabled: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitoringConfiguration:
     """Configuration for monitoring and logging."""
     log_level: LogLevel = LogLevel.INFO
@@ -130,7 +134,7 @@ class MonitoringConfiguration:
     enable_performance_profiling: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionConfiguration:
     """Main execution configuration."""
     mode: ExecutionMode = ExecutionMode.FULL_AUTO
@@ -150,6 +154,116 @@ class ExecutionConfiguration:
     })
 
 
+@dataclass(slots=True)
+class ValidationIssue:
+    """A single configuration validation problem.
+
+    Carries a stable machine-readable code alongside the human-readable
+    detail so callers can match on codes instead of message wording.
+    """
+    code: str
+    detail: str
+
+    def __str__(self) -> str:
+        return self.detail
+
+    def __contains__(self, item: str) -> bool:
+        # Keep legacy substring checks against the message working.
+        return item in self.detail
+
+
+# Quality threshold fields checked by validate_configuration, resolved once
+# at import time instead of rebuilt on every validation call.
+_QUALITY_THRESHOLD_ATTRS = (
+    "min_technical_accuracy", "min_clarity_score",
+    "min_explanation_score", "min_japanese_quality"
+)
+
+# Default domain configurations based on SOA-C03 exam guide, built once at
+# import time and field-copied per ConfigurationManager instance.
+_DEFAULT_DOMAINS: Dict[str, DomainConfiguration] = {
+    "monitoring": DomainConfiguration(
+        name="Monitoring, Logging, and Remediation",
+        target_questions=44,  # 22% of 200
+        weight_percentage=22.0,
+        priority=1,
+        focus_topics=["CloudWatch", "CloudTrail", "AWS Config", "Systems Manager"],
+        aws_services=["CloudWatch", "CloudTrail", "Config", "Systems Manager", "X-Ray"]
+    ),
+    "reliability": DomainConfiguration(
+        name="Reliability and Business Continuity",
+        target_questions=44,  # 22% of 200
+        weight_percentage=22.0,
+        priority=1,
+        focus_topics=["Backup", "Disaster Recovery", "High Availability", "Auto Scaling"],
+        aws_services=["Backup", "RDS", "EC2", "ELB", "Auto Scaling", "Route 53"]
+    ),
+    "deployment": DomainConfiguration(
+        name="Deployment, Provisioning, and Automation",
+        target_questions=44,  # 22% of 200
+        weight_percentage=22.0,
+        priority=1,
+        focus_topics=["CloudFormation", "CodeDeploy", "Systems Manager", "Elastic Beanstalk"],
+        aws_services=["CloudFormation", "CodeDeploy", "CodePipeline", "Elastic Beanstalk", "Systems Manager"]
+    ),
+    "security": DomainConfiguration(
+        name="Security and Compliance",
+        target_questions=32,  # 16% of 200
+        weight_percentage=16.0,
+        priority=2,
+        focus_topics=["IAM", "Security Groups", "KMS", "CloudTrail", "Config"],
+        aws_services=["IAM", "KMS", "CloudTrail", "Config", "Security Hub", "GuardDuty"]
+    ),
+    "networking": DomainConfiguration(
+        name="Networking and Content Delivery",
+        target_questions=36,  # 18% of 200
+        weight_percentage=18.0,
+        priority=2,
+        focus_topics=["VPC", "CloudFront", "Route 53", "ELB", "Direct Connect"],
+        aws_services=["VPC", "CloudFront", "Route 53", "ELB", "Direct Connect", "API Gateway"]
+    )
+}
+
+# Default agent configurations, also built once at import time.
+_DEFAULT_AGENTS: Dict[str, AgentConfiguration] = {
+    "exam_analyzer": AgentConfiguration(
+        temperature=0.3,  # Lower temperature for analysis
+        max_tokens=3000,
+        timeout_seconds=180
+    ),
+    "batch_manager": AgentConfiguration(
+        temperature=0.5,
+        max_tokens=2000,
+        timeout_seconds=120
+    ),
+    "aws_knowledge_agent": AgentConfiguration(
+        temperature=0.4,
+        max_tokens=4000,
+        timeout_seconds=300  # Longer timeout for research
+    ),
+    "question_generator": AgentConfiguration(
+        temperature=0.7,  # Higher temperature for creativity
+        max_tokens=4000,
+        timeout_seconds=240
+    ),
+    "quality_validator": AgentConfiguration(
+        temperature=0.2,  # Very low temperature for validation
+        max_tokens=3000,
+        timeout_seconds=180
+    ),
+    "japanese_optimizer": AgentConfiguration(
+        temperature=0.6,
+        max_tokens=3000,
+        timeout_seconds=150
+    ),
+    "database_integrator": AgentConfiguration(
+        temperature=0.1,  # Minimal temperature for integration
+        max_tokens=2000,
+        timeout_seconds=120
+    )
+}
+
+
 class ConfigurationManager:
     """
     Comprehensive configuration management system.
@@ -158,15 +272,22 @@ class ConfigurationManager:
     all configuration settings for the question generation system.
     """
     
-    def __init__(self, config_file: str = "config/execution_config.yaml"):
+    def __init__(
+        self,
+        config_file: str = "config/execution_config.yaml",
+        persist_defaults: bool = True
+    ):
         """
         Initialize the configuration manager.
-        
+
         Args:
             config_file: Path to the main configuration file
+            persist_defaults: Whether to write the default configuration to
+                disk when no configuration file exists yet
         """
         self.config_file = Path(config_file)
         self.config_dir = self.config_file.parent
+        self.persist_defaults = persist_defaults
         
         # Ensure config directory exists
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -183,13 +304,23 @@ class ConfigurationManager:
         self.monitoring_config = MonitoringConfiguration()
         self.execution_config = ExecutionConfiguration()
         
+        # Memoized aggregate views, invalidated whenever configuration mutates
+        self._runtime_cache: Optional[Dict[str, Any]] = None
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        
         # Load configuration
         self.load_configuration()
         
         self.logger.info("ConfigurationManager initialized")
     
+    def _invalidate_caches(self) -> None:
+        """Drop memoized aggregate views after a configuration change."""
+        self._runtime_cache = None
+        self._summary_cache = None
+    
     def load_configuration(self) -> None:
         """Load configuration from file or create default configuration."""
+        self._invalidate_caches()
         try:
             if self.config_file.exists():
                 self.logger.info(f"Loading configuration from {self.config_file}")
@@ -205,7 +336,8 @@ class ConfigurationManager:
             else:
                 self.logger.info("No configuration file found, creating default configuration")
                 self._create_default_configuration()
-                self.save_configuration()
+                if self.persist_defaults:
+                    self.save_configuration()
         
         except Exception as e:
             self.logger.error(f"Failed to load configuration: {e}")
@@ -214,87 +346,24 @@ class ConfigurationManager:
     
     def _create_default_configuration(self) -> None:
         """Create default configuration settings."""
-        # Default domain configurations based on SOA-C03 exam guide
+        # Field-copy the import-time prototypes instead of rebuilding each
+        # dataclass from its default factories. The container fields are
+        # copied explicitly: a bare replace() would share them between the
+        # prototypes and every instance, so mutating one manager's config
+        # would corrupt the process-wide defaults.
         self.domains = {
-            "monitoring": DomainConfiguration(
-                name="Monitoring, Logging, and Remediation",
-                target_questions=44,  # 22% of 200
-                weight_percentage=22.0,
-                priority=1,
-                focus_topics=["CloudWatch", "CloudTrail", "AWS Config", "Systems Manager"],
-                aws_services=["CloudWatch", "CloudTrail", "Config", "Systems Manager", "X-Ray"]
-            ),
-            "reliability": DomainConfiguration(
-                name="Reliability and Business Continuity",
-                target_questions=44,  # 22% of 200
-                weight_percentage=22.0,
-                priority=1,
-                focus_topics=["Backup", "Disaster Recovery", "High Availability", "Auto Scaling"],
-                aws_services=["Backup", "RDS", "EC2", "ELB", "Auto Scaling", "Route 53"]
-            ),
-            "deployment": DomainConfiguration(
-                name="Deployment, Provisioning, and Automation",
-                target_questions=44,  # 22% of 200
-                weight_percentage=22.0,
-                priority=1,
-                focus_topics=["CloudFormation", "CodeDeploy", "Systems Manager", "Elastic Beanstalk"],
-                aws_services=["CloudFormation", "CodeDeploy", "CodePipeline", "Elastic Beanstalk", "Systems Manager"]
-            ),
-            "security": DomainConfiguration(
-                name="Security and Compliance",
-                target_questions=32,  # 16% of 200
-                weight_percentage=16.0,
-                priority=2,
-                focus_topics=["IAM", "Security Groups", "KMS", "CloudTrail", "Config"],
-                aws_services=["IAM", "KMS", "CloudTrail", "Config", "Security Hub", "GuardDuty"]
-            ),
-            "networking": DomainConfiguration(
-                name="Networking and Content Delivery",
-                target_questions=36,  # 18% of 200
-                weight_percentage=18.0,
-                priority=2,
-                focus_topics=["VPC", "CloudFront", "Route 53", "ELB", "Direct Connect"],
-                aws_services=["VPC", "CloudFront", "Route 53", "ELB", "Direct Connect", "API Gateway"]
+            name: replace(
+                config,
+                difficulty_distribution=dict(config.difficulty_distribution),
+                question_types=dict(config.question_types),
+                focus_topics=list(config.focus_topics),
+                aws_services=list(config.aws_services)
             )
+            for name, config in _DEFAULT_DOMAINS.items()
         }
-        
-        # Default agent configurations
         self.agents = {
-            "exam_analyzer": AgentConfiguration(
-                temperature=0.3,  # Lower temperature for analysis
-                max_tokens=3000,
-                timeout_seconds=180
-            ),
-            "batch_manager": AgentConfiguration(
-                temperature=0.5,
-                max_tokens=2000,
-                timeout_seconds=120
-            ),
-            "aws_knowledge_agent": AgentConfiguration(
-                temperature=0.4,
-                max_tokens=4000,
-                timeout_seconds=300  # Longer timeout for research
-            ),
-            "question_generator": AgentConfiguration(
-                temperature=0.7,  # Higher temperature for creativity
-                max_tokens=4000,
-                timeout_seconds=240
-            ),
-            "quality_validator": AgentConfiguration(
-                temperature=0.2,  # Very low temperature for validation
-                max_tokens=3000,
-                timeout_seconds=180
-            ),
-            "japanese_optimizer": AgentConfiguration(
-                temperature=0.6,
-                max_tokens=3000,
-                timeout_seconds=150
-            ),
-            "database_integrator": AgentConfiguration(
-                temperature=0.1,  # Minimal temperature for integration
-                max_tokens=2000,
-                timeout_seconds=120
-            )
+            name: replace(config, model_overrides=dict(config.model_overrides))
+            for name, config in _DEFAULT_AGENTS.items()
         }
     
     def _parse_configuration(self, config_data: Dict[str, Any]) -> None:
@@ -307,7 +376,10 @@ class ConfigurationManager:
         
         # Parse batch configuration
         if "batch" in config_data:
-            self.batch_config = BatchConfiguration(**config_data["batch"])
+            batch_data = config_data["batch"].copy()
+            if "strategy" in batch_data:
+                batch_data["strategy"] = BatchStrategy(batch_data["strategy"])
+            self.batch_config = BatchConfiguration(**batch_data)
         
         # Parse agent configurations
         if "agents" in config_data:
@@ -344,7 +416,10 @@ class ConfigurationManager:
                 "domains": {
                     name: asdict(config) for name, config in self.domains.items()
                 },
-                "batch": asdict(self.batch_config),
+                "batch": {
+                    **asdict(self.batch_config),
+                    "strategy": self.batch_config.strategy.value
+                },
                 "agents": {
                     name: asdict(config) for name, config in self.agents.items()
                 },
@@ -363,7 +438,11 @@ class ConfigurationManager:
             
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 if self.config_file.suffix.lower() == '.yaml':
-                    yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+                    yaml.dump(
+                        config_data, f, Dumper=_YamlDumper,
+                        default_flow_style=False, allow_unicode=True,
+                        sort_keys=False
+                    )
                 else:
                     json.dump(config_data, f, ensure_ascii=False, indent=2)
             
@@ -376,29 +455,43 @@ class ConfigurationManager:
         """Get configuration for a specific domain."""
         return self.domains.get(domain_name)
     
-    def update_domain_config(self, domain_name: str, **kwargs) -> None:
-        """Update configuration for a specific domain."""
+    def update_domain_config(self, domain_name: str, **kwargs) -> Optional[DomainConfiguration]:
+        """Update configuration for a specific domain.
+
+        Returns:
+            The updated domain configuration, or None if the domain is unknown
+        """
         if domain_name in self.domains:
             for key, value in kwargs.items():
                 if hasattr(self.domains[domain_name], key):
                     setattr(self.domains[domain_name], key, value)
+            self._invalidate_caches()
             self.logger.info(f"Updated domain configuration for {domain_name}")
+            return self.domains[domain_name]
         else:
             self.logger.warning(f"Domain {domain_name} not found in configuration")
+            return None
     
     def get_agent_config(self, agent_name: str) -> Optional[AgentConfiguration]:
         """Get configuration for a specific agent."""
         return self.agents.get(agent_name)
     
-    def update_agent_config(self, agent_name: str, **kwargs) -> None:
-        """Update configuration for a specific agent."""
+    def update_agent_config(self, agent_name: str, **kwargs) -> Optional[AgentConfiguration]:
+        """Update configuration for a specific agent.
+
+        Returns:
+            The updated agent configuration, or None if the agent is unknown
+        """
         if agent_name in self.agents:
             for key, value in kwargs.items():
                 if hasattr(self.agents[agent_name], key):
                     setattr(self.agents[agent_name], key, value)
+            self._invalidate_caches()
             self.logger.info(f"Updated agent configuration for {agent_name}")
+            return self.agents[agent_name]
         else:
             self.logger.warning(f"Agent {agent_name} not found in configuration")
+            return None
     
     def adjust_batch_size(self, new_size: int) -> None:
         """Dynamically adjust batch size."""
@@ -408,6 +501,7 @@ class ConfigurationManager:
             # Recalculate total batches
             total_questions = 189  # 200 - 11 existing
             self.batch_config.total_batches = (total_questions + new_size - 1) // new_size
+            self._invalidate_caches()
             self.logger.info(f"Batch size adjusted from {old_size} to {new_size}")
             self.logger.info(f"Total batches recalculated to {self.batch_config.total_batches}")
         else:
@@ -416,6 +510,7 @@ class ConfigurationManager:
     def set_execution_mode(self, mode: ExecutionMode) -> None:
         """Set execution mode."""
         self.execution_config.mode = mode
+        self._invalidate_caches()
         self.logger.info(f"Execution mode set to {mode.value}")
     
     def enable_debug_mode(self) -> None:
@@ -423,6 +518,7 @@ class ConfigurationManager:
         self.execution_config.mode = ExecutionMode.DEBUG
         self.monitoring_config.log_level = LogLevel.DEBUG
         self.monitoring_config.enable_performance_profiling = True
+        self._invalidate_caches()
         self.logger.info("Debug mode enabled")
     
     def adjust_quality_thresholds(self, **thresholds) -> None:
@@ -430,11 +526,15 @@ class ConfigurationManager:
         for threshold_name, value in thresholds.items():
             if hasattr(self.quality_config, threshold_name):
                 setattr(self.quality_config, threshold_name, value)
+                self._invalidate_caches()
                 self.logger.info(f"Quality threshold {threshold_name} set to {value}")
     
     def get_runtime_parameters(self) -> Dict[str, Any]:
         """Get parameters for runtime execution."""
-        return {
+        if self._runtime_cache is not None:
+            return self._runtime_cache
+        
+        self._runtime_cache = {
             "batch_size": self.batch_config.batch_size,
             "total_batches": self.batch_config.total_batches,
             "execution_mode": self.execution_config.mode.value,
@@ -458,8 +558,9 @@ class ConfigurationManager:
                 for name, config in self.agents.items()
             }
         }
+        return self._runtime_cache
     
-    def validate_configuration(self) -> Tuple[bool, List[str]]:
+    def validate_configuration(self) -> Tuple[bool, List["ValidationIssue"]]:
         """
         Validate the current configuration.
         
@@ -471,48 +572,69 @@ class ConfigurationManager:
         # Validate domain distribution
         total_questions = sum(config.target_questions for config in self.domains.values())
         if total_questions != 200:
-            issues.append(f"Domain distribution totals {total_questions}, expected 200")
+            issues.append(ValidationIssue(
+                "DOMAIN_DIST_MISMATCH",
+                f"Domain distribution totals {total_questions}, expected 200"
+            ))
         
         total_weight = sum(config.weight_percentage for config in self.domains.values())
         if abs(total_weight - 100.0) > 0.1:
-            issues.append(f"Domain weights total {total_weight}%, expected 100%")
+            issues.append(ValidationIssue(
+                "DOMAIN_WEIGHT_MISMATCH",
+                f"Domain weights total {total_weight}%, expected 100%"
+            ))
         
         # Validate batch configuration
         if self.batch_config.batch_size <= 0:
-            issues.append("Batch size must be positive")
+            issues.append(ValidationIssue(
+                "BATCH_SIZE_INVALID", "Batch size must be positive"
+            ))
         
         if self.batch_config.total_batches <= 0:
-            issues.append("Total batches must be positive")
+            issues.append(ValidationIssue(
+                "TOTAL_BATCHES_INVALID", "Total batches must be positive"
+            ))
         
         # Validate agent configurations
         for agent_name, config in self.agents.items():
             if config.temperature < 0 or config.temperature > 2:
-                issues.append(f"Agent {agent_name} temperature {config.temperature} out of range [0, 2]")
+                issues.append(ValidationIssue(
+                    "AGENT_TEMPERATURE_RANGE",
+                    f"Agent {agent_name} temperature {config.temperature} out of range [0, 2]"
+                ))
             
             if config.max_tokens <= 0:
-                issues.append(f"Agent {agent_name} max_tokens must be positive")
+                issues.append(ValidationIssue(
+                    "AGENT_MAX_TOKENS_INVALID",
+                    f"Agent {agent_name} max_tokens must be positive"
+                ))
         
         # Validate quality thresholds
-        quality_attrs = [
-            "min_technical_accuracy", "min_clarity_score", 
-            "min_explanation_score", "min_japanese_quality"
-        ]
-        for attr in quality_attrs:
+        for attr in _QUALITY_THRESHOLD_ATTRS:
             value = getattr(self.quality_config, attr)
             if value < 0 or value > 10:
-                issues.append(f"Quality threshold {attr} {value} out of range [0, 10]")
+                issues.append(ValidationIssue(
+                    "QUALITY_THRESHOLD_RANGE",
+                    f"Quality threshold {attr} {value} out of range [0, 10]"
+                ))
         
         # Validate file paths
         database_path = Path(self.database_config.database_path)
         if not database_path.parent.exists():
-            issues.append(f"Database directory does not exist: {database_path.parent}")
+            issues.append(ValidationIssue(
+                "DATABASE_DIR_MISSING",
+                f"Database directory does not exist: {database_path.parent}"
+            ))
         
         backup_dir = Path(self.database_config.backup_directory)
         if not backup_dir.exists():
             try:
                 backup_dir.mkdir(parents=True, exist_ok=True)
             except Exception as e:
-                issues.append(f"Cannot create backup directory: {e}")
+                issues.append(ValidationIssue(
+                    "BACKUP_DIR_CREATE_FAILED",
+                    f"Cannot create backup directory: {e}"
+                ))
         
         return len(issues) == 0, issues
     
@@ -539,9 +661,12 @@ class ConfigurationManager:
     
     def get_configuration_summary(self) -> Dict[str, Any]:
         """Get a summary of current configuration."""
+        if self._summary_cache is not None:
+            return self._summary_cache
+        
         is_valid, issues = self.validate_configuration()
         
-        return {
+        self._summary_cache = {
             "configuration_file": str(self.config_file),
             "is_valid": is_valid,
             "validation_issues": issues,
@@ -575,6 +700,7 @@ class ConfigurationManager:
                 "validation_threshold": self.batch_config.validation_threshold
             }
         }
+        return self._summary_cache
     
     def export_configuration(self, export_path: str) -> None:
         """Export configuration to a different file."""
@@ -11,7 +11,7 @@ import json
 import shutil
 import hashlib
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import logging
 
@@ -42,18 +42,26 @@ class DatabaseIntegrationAgent:
     - JSON structure integrity validation
     """
     
-    def __init__(self, agent: Agent, database_path: str, backup_dir: str = "backups"):
+    def __init__(
+        self,
+        agent: Agent,
+        database_path: str,
+        backup_dir: str = "backups",
+        copier: Callable[..., Any] = shutil.copy2
+    ):
         """
         Initialize the Database Integration Agent.
-        
+
         Args:
             agent: Configured Strands Agent for structured output
             database_path: Path to the questions.json file
             backup_dir: Directory for storing backups
+            copier: File copy function used when creating backups
         """
         self.agent = agent
         self.database_path = Path(database_path)
         self.backup_dir = Path(backup_dir)
+        self._copier = copier
         
         # Ensure backup directory exists
         self.backup_dir.mkdir(exist_ok=True)
@@ -84,7 +92,7 @@ class DatabaseIntegrationAgent:
             backup_path = self.backup_dir / f"{backup_id}.json"
             
             # Copy the database file
-            shutil.copy2(self.database_path, backup_path)
+            self._copier(self.database_path, backup_path)
             
             # Calculate checksum for integrity verification
             checksum = self._calculate_checksum(backup_path)
@@ -116,11 +124,8 @@ class DatabaseIntegrationAgent:
     
     def _calculate_checksum(self, file_path: Path) -> str:
         """Calculate SHA-256 checksum of a file."""
-        sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
     
     def validate_json_structure(self, data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
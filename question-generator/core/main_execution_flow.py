@@ -7,12 +7,21 @@ generation → validation → optimization → integration workflow.
 """
 
 import asyncio
+import copy
 import json
 import logging
+import mmap
+import os
+import pickle
+import struct
+import time
+import zlib
+from collections import Counter
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
 # Strands Agents imports
@@ -32,6 +41,17 @@ from models import (
 )
 
 
+# Anchor pair for converting monotonic timestamps to wall-clock datetimes
+# only when a report or snapshot needs them.
+_MONOTONIC_ANCHOR_NS = time.monotonic_ns()
+_WALL_ANCHOR = datetime.now()
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    """Convert a time.monotonic_ns() reading to an approximate datetime."""
+    return _WALL_ANCHOR + timedelta(microseconds=(ns - _MONOTONIC_ANCHOR_NS) / 1000)
+
+
 class FlowStatus(Enum):
     """Status of the execution flow."""
     NOT_STARTED = "not_started"
@@ -58,13 +78,17 @@ class BatchStatus(Enum):
     RETRYING = "retrying"
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchProgress:
     """Progress tracking for individual batch."""
     batch_number: int
     status: BatchStatus = BatchStatus.PENDING
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
+    # Internal timing uses monotonic ns: cheaper to record than datetime.now()
+    # and immune to wall-clock jumps; converted to datetimes lazily.
+    start_ns: Optional[int] = None
+    end_ns: Optional[int] = None
     current_step: str = ""
     steps_completed: int = 0
     total_steps: int = 7  # analyze, plan, research, generate, validate, optimize, integrate
@@ -75,8 +99,115 @@ class BatchProgress:
     retry_count: int = 0
     max_retries: int = 3
 
+    def start_datetime(self) -> Optional[datetime]:
+        """Wall-clock start time, derived from start_ns when needed."""
+        if self.start_time is None and self.start_ns is not None:
+            self.start_time = _ns_to_datetime(self.start_ns)
+        return self.start_time
+
+    def end_datetime(self) -> Optional[datetime]:
+        """Wall-clock end time, derived from end_ns when needed."""
+        if self.end_time is None and self.end_ns is not None:
+            self.end_time = _ns_to_datetime(self.end_ns)
+        return self.end_time
+
+
+def _generate_batch_to_dict():
+    """Generate a straight-line serializer for BatchProgress at import time.
+
+    The function body is built from the dataclass field list, so newly added
+    fields are serialized automatically, and the result is plain attribute
+    access with no per-call field iteration. Timestamps are passed in
+    pre-converted and the in-memory-only fields are skipped.
+    """
+    skipped = {'status', 'start_time', 'end_time', 'start_ns', 'end_ns',
+               'integration_result'}
+    lines = [
+        "def _batch_to_dict(bp, start_time, end_time):",
+        "    return {",
+        "        'batch_number': bp.batch_number,",
+        "        'status': bp.status.value,",
+        "        'start_time': start_time.isoformat() if start_time else None,",
+        "        'end_time': end_time.isoformat() if end_time else None,",
+    ]
+    for f in fields(BatchProgress):
+        if f.name == 'batch_number' or f.name in skipped:
+            continue
+        lines.append(f"        '{f.name}': bp.{f.name},")
+    lines.append("    }")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace['_batch_to_dict']
+
+
+_batch_to_dict = _generate_batch_to_dict()
+
+# Prototype copied when seeding the 19 batch entries; copy.copy is cheaper
+# than re-running the dataclass __init__ and every field is an immutable
+# scalar, so the shallow copy shares no mutable state.
+_BATCH_PROGRESS_PROTO = BatchProgress(batch_number=0)
+
+
+class BatchProgressTable:
+    """Dense table of BatchProgress entries keyed by 1-based batch number.
+
+    Batch numbers form a contiguous 1..19 range, so entries are stored in a
+    plain list and looked up by index instead of dict hashing. The mapping
+    surface (indexing, ``in``, ``len``, ``values``/``items``) matches the
+    dict this replaces, so call sites keep their 1-based keying.
+    """
+
+    __slots__ = ('_entries',)
+
+    def __init__(self):
+        self._entries: List[Optional[BatchProgress]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, batch_number: int) -> bool:
+        return (
+            1 <= batch_number <= len(self._entries)
+            and self._entries[batch_number - 1] is not None
+        )
+
+    def __getitem__(self, batch_number: int) -> BatchProgress:
+        if not 1 <= batch_number <= len(self._entries):
+            raise KeyError(batch_number)
+        entry = self._entries[batch_number - 1]
+        if entry is None:
+            raise KeyError(batch_number)
+        return entry
+
+    def __setitem__(self, batch_number: int, entry: BatchProgress) -> None:
+        index = batch_number - 1
+        if index >= len(self._entries):
+            self._entries.extend([None] * (index + 1 - len(self._entries)))
+        self._entries[index] = entry
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self) -> List[int]:
+        return [entry.batch_number for entry in self._entries if entry is not None]
+
+    def values(self) -> List[BatchProgress]:
+        return [entry for entry in self._entries if entry is not None]
+
+    def items(self) -> List[Tuple[int, BatchProgress]]:
+        return [
+            (entry.batch_number, entry)
+            for entry in self._entries if entry is not None
+        ]
+
+    def status_counts(self) -> Counter:
+        """Aggregate batch statuses in one C-level pass."""
+        return Counter(
+            entry.status for entry in self._entries if entry is not None
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class FlowProgress:
     """Overall flow progress tracking."""
     status: FlowStatus = FlowStatus.NOT_STARTED
@@ -86,7 +217,7 @@ class FlowProgress:
     completed_batches: int = 0
     failed_batches: int = 0
     current_batch: Optional[int] = None
-    batch_progress: Dict[int, BatchProgress] = field(default_factory=dict)
+    batch_progress: BatchProgressTable = field(default_factory=BatchProgressTable)
     total_questions_generated: int = 0
     overall_validation_score: float = 0.0
     estimated_completion_time: Optional[datetime] = None
@@ -146,125 +277,250 @@ class MainExecutionFlow:
         
         # Initialize components
         self.agent_factory = AgentFactory(config)
+        self.reset_progress()
+
+        self._compaction_interval = 5
+
+        # Debounced checkpointing: request_save coalesces the rapid per-step
+        # saves into at most one write per interval; save_state itself stays
+        # synchronous so transition points persist immediately.
+        self._save_debounce_seconds = 0.5
+
+        # Number of batches processed concurrently; batch work is dominated
+        # by remote agent calls, so modest parallelism cuts wall-clock time.
+        self.max_parallel_batches = 3
+
+        self.logger.info("MainExecutionFlow initialized")
+
+    def reset_progress(self) -> None:
+        """Reset in-memory progress and checkpoint caches for a fresh run."""
         self.progress = FlowProgress()
-        
+
         # Initialize batch progress tracking
         for i in range(1, 20):  # Batches 1-19
-            self.progress.batch_progress[i] = BatchProgress(batch_number=i)
-        
-        # Agent instances (will be created on demand)
-        self._exam_analyzer = None
-        self._batch_manager = None
-        self._aws_knowledge_agent = None
-        self._question_generator = None
-        self._quality_validator = None
-        self._db_integration_agent = None
-        self._workflow_agent = None
-        
-        self.logger.info("MainExecutionFlow initialized")
+            batch_progress = copy.copy(_BATCH_PROGRESS_PROTO)
+            batch_progress.batch_number = i
+            self.progress.batch_progress[i] = batch_progress
+
+        # Delta checkpointing: per-batch dicts as last written to the state
+        # log, and a counter driving periodic compaction of the log.
+        self._logged_batch_state: Dict[int, Dict[str, Any]] = {}
+        # Rendered per-batch report fragments keyed by batch number, each
+        # stored with the field fingerprint it was rendered from.
+        self._batch_report_cache: Dict[int, Tuple[Tuple, Dict[str, Any]]] = {}
+        self._deltas_since_compaction = 0
+        self._last_save_monotonic = float('-inf')
+        self._save_pending = False
     
-    @property
+    @cached_property
     def exam_analyzer(self) -> Agent:
         """Lazy initialization of exam guide analyzer."""
-        if self._exam_analyzer is None:
-            self._exam_analyzer = self.agent_factory.create_exam_guide_analyzer()
-        return self._exam_analyzer
-    
-    @property
+        return self.agent_factory.create_exam_guide_analyzer()
+
+    @cached_property
     def batch_manager(self) -> Agent:
         """Lazy initialization of batch manager."""
-        if self._batch_manager is None:
-            self._batch_manager = self.agent_factory.create_batch_manager()
-        return self._batch_manager
-    
-    @property
+        return self.agent_factory.create_batch_manager()
+
+    @cached_property
     def aws_knowledge_agent(self):
         """Lazy initialization of AWS knowledge agent."""
-        if self._aws_knowledge_agent is None:
-            self._aws_knowledge_agent = self.agent_factory.create_aws_knowledge_agent()
-        return self._aws_knowledge_agent
-    
-    @property
+        return self.agent_factory.create_aws_knowledge_agent()
+
+    @cached_property
     def question_generator(self) -> Agent:
         """Lazy initialization of question generator."""
-        if self._question_generator is None:
-            self._question_generator = self.agent_factory.create_question_generator()
-        return self._question_generator
-    
-    @property
+        return self.agent_factory.create_question_generator()
+
+    @cached_property
     def quality_validator(self) -> Agent:
         """Lazy initialization of quality validator."""
-        if self._quality_validator is None:
-            self._quality_validator = self.agent_factory.create_quality_validator()
-        return self._quality_validator
-    
-    @property
+        return self.agent_factory.create_quality_validator()
+
+    @cached_property
     def db_integration_agent(self) -> DatabaseIntegrationAgent:
         """Lazy initialization of database integration agent."""
-        if self._db_integration_agent is None:
-            self._db_integration_agent = self.agent_factory.create_database_integration_agent(
-                database_path=str(self.database_path),
-                backup_dir=str(self.backup_dir)
-            )
-        return self._db_integration_agent
-    
-    @property
+        return self.agent_factory.create_database_integration_agent(
+            database_path=str(self.database_path),
+            backup_dir=str(self.backup_dir)
+        )
+
+    @cached_property
     def workflow_agent(self) -> Agent:
         """Lazy initialization of workflow orchestration agent."""
-        if self._workflow_agent is None:
-            self._workflow_agent = Agent(
-                model=self.agent_factory._initialize_bedrock(),
-                system_prompt="""You are a workflow orchestration agent for AI question generation.
-                You coordinate complex multi-step processes with proper dependency management,
-                parallel execution where possible, and comprehensive error handling."""
-            )
-        return self._workflow_agent
+        return Agent(
+            model=self.agent_factory._initialize_bedrock(),
+            system_prompt="""You are a workflow orchestration agent for AI question generation.
+            You coordinate complex multi-step processes with proper dependency management,
+            parallel execution where possible, and comprehensive error handling."""
+        )
     
+    def _progress_snapshot(self) -> Dict[str, Any]:
+        """Serialize the flow-level progress fields to a plain dict."""
+        return {
+            'status': self.progress.status.value,
+            'start_time': self.progress.start_time.isoformat() if self.progress.start_time else None,
+            'end_time': self.progress.end_time.isoformat() if self.progress.end_time else None,
+            'total_batches': self.progress.total_batches,
+            'completed_batches': self.progress.completed_batches,
+            'failed_batches': self.progress.failed_batches,
+            'current_batch': self.progress.current_batch,
+            'total_questions_generated': self.progress.total_questions_generated,
+            'overall_validation_score': self.progress.overall_validation_score,
+            'estimated_completion_time': self.progress.estimated_completion_time.isoformat() if self.progress.estimated_completion_time else None,
+            'pause_requested': self.progress.pause_requested,
+            'recovery_mode': self.progress.recovery_mode
+        }
+
+    @staticmethod
+    def _batch_snapshot(batch_progress: BatchProgress) -> Dict[str, Any]:
+        """Serialize a single BatchProgress to a plain dict."""
+        return _batch_to_dict(
+            batch_progress,
+            batch_progress.start_datetime(),
+            batch_progress.end_datetime()
+        )
+
+    def _completed_bitmap(self) -> int:
+        """Bitmap with bit N set when batch N is completed."""
+        bitmap = 0
+        for batch_num, batch_progress in self.progress.batch_progress.items():
+            if batch_progress.status == BatchStatus.COMPLETED:
+                bitmap |= 1 << batch_num
+        return bitmap
+
+    @staticmethod
+    def _read_state_frames(raw: bytes) -> List[Dict[str, Any]]:
+        """Parse a state file into its frames, oldest first.
+
+        State files from older runs are text JSON (they start with '{');
+        current ones hold length-prefixed pickle frames, each trailed by a
+        CRC32 of its payload. A truncated or corrupt trailing frame (crash
+        mid-append) is simply dropped.
+        """
+        if raw[:1] == b'{':
+            return [json.loads(raw)]
+
+        frames = []
+        offset = 0
+        while offset + 4 <= len(raw):
+            (length,) = struct.unpack_from('<I', raw, offset)
+            if offset + 8 + length > len(raw):
+                break
+            data = raw[offset + 4:offset + 4 + length]
+            (crc,) = struct.unpack_from('<I', raw, offset + 4 + length)
+            if zlib.crc32(data) != crc:
+                break
+            frames.append(pickle.loads(data))
+            offset += 8 + length
+        if not frames:
+            # Unframed binary snapshot from an older run
+            frames = [pickle.loads(raw)]
+        return frames
+
+    def _append_state_frame(self, state_data: Dict[str, Any]) -> None:
+        """Append one length-prefixed, CRC-trailed pickle frame to the state file."""
+        data = pickle.dumps(state_data, protocol=5)
+        with open(self.state_file, 'ab') as f:
+            f.write(struct.pack('<I', len(data)))
+            f.write(data)
+            f.write(struct.pack('<I', zlib.crc32(data)))
+            f.flush()
+            os.fsync(f.fileno())
+
     def save_state(self) -> None:
-        """Save current execution state to file."""
+        """Save current execution state to file.
+
+        Rather than rewriting all 19 batch entries on every call, each save
+        appends one delta frame containing the flow-level header plus only
+        the batches that changed since the previous save. The log is folded
+        back into a single snapshot frame every few saves (see
+        compact_state), keeping per-batch checkpoint cost O(changed)
+        instead of O(batches_so_far).
+        """
         try:
+            dirty_batches = {}
+            for batch_num, batch_progress in self.progress.batch_progress.items():
+                snapshot = self._batch_snapshot(batch_progress)
+                if self._logged_batch_state.get(batch_num) != snapshot:
+                    dirty_batches[batch_num] = snapshot
+
             state_data = {
-                'progress': {
-                    'status': self.progress.status.value,
-                    'start_time': self.progress.start_time.isoformat() if self.progress.start_time else None,
-                    'end_time': self.progress.end_time.isoformat() if self.progress.end_time else None,
-                    'total_batches': self.progress.total_batches,
-                    'completed_batches': self.progress.completed_batches,
-                    'failed_batches': self.progress.failed_batches,
-                    'current_batch': self.progress.current_batch,
-                    'total_questions_generated': self.progress.total_questions_generated,
-                    'overall_validation_score': self.progress.overall_validation_score,
-                    'estimated_completion_time': self.progress.estimated_completion_time.isoformat() if self.progress.estimated_completion_time else None,
-                    'pause_requested': self.progress.pause_requested,
-                    'recovery_mode': self.progress.recovery_mode
-                },
+                'progress': self._progress_snapshot(),
                 'batch_progress': {
-                    str(batch_num): {
-                        'batch_number': batch_progress.batch_number,
-                        'status': batch_progress.status.value,
-                        'start_time': batch_progress.start_time.isoformat() if batch_progress.start_time else None,
-                        'end_time': batch_progress.end_time.isoformat() if batch_progress.end_time else None,
-                        'current_step': batch_progress.current_step,
-                        'steps_completed': batch_progress.steps_completed,
-                        'total_steps': batch_progress.total_steps,
-                        'questions_generated': batch_progress.questions_generated,
-                        'validation_score': batch_progress.validation_score,
-                        'error_message': batch_progress.error_message,
-                        'retry_count': batch_progress.retry_count,
-                        'max_retries': batch_progress.max_retries
-                    }
-                    for batch_num, batch_progress in self.progress.batch_progress.items()
+                    str(batch_num): snapshot
+                    for batch_num, snapshot in dirty_batches.items()
                 },
+                'completed_bitmap': self._completed_bitmap(),
                 'saved_at': datetime.now().isoformat()
             }
-            
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(state_data, f, ensure_ascii=False, indent=2)
-            
+
+            self._append_state_frame(state_data)
+            self._logged_batch_state.update(dirty_batches)
+
+            self._deltas_since_compaction += 1
+            if self._deltas_since_compaction >= self._compaction_interval:
+                self.compact_state()
+
+            self._last_save_monotonic = time.monotonic()
+            self._save_pending = False
+
             self.logger.debug("Execution state saved")
-            
+
         except Exception as e:
             self.logger.error(f"Failed to save execution state: {e}")
+
+    def request_save(self) -> None:
+        """Request a checkpoint, coalescing rapid requests.
+
+        The per-step handlers checkpoint up to 7 times per batch; writing
+        (and fsyncing) each one individually is wasted bandwidth. A request
+        within the debounce interval of the previous write only marks the
+        state dirty; flush_state or the next save_state picks it up.
+        """
+        if time.monotonic() - self._last_save_monotonic >= self._save_debounce_seconds:
+            self.save_state()
+        else:
+            self._save_pending = True
+
+    def flush_state(self) -> None:
+        """Write any coalesced checkpoint request immediately."""
+        if self._save_pending:
+            self.save_state()
+
+    def compact_state(self) -> None:
+        """Fold the delta log into a single full-snapshot frame.
+
+        The snapshot is written to a temp file and moved into place with
+        os.replace so a crash mid-compaction never loses the old log.
+        """
+        state_data = {
+            'progress': self._progress_snapshot(),
+            'batch_progress': {
+                str(batch_num): self._batch_snapshot(batch_progress)
+                for batch_num, batch_progress in self.progress.batch_progress.items()
+            },
+            'completed_bitmap': self._completed_bitmap(),
+            'saved_at': datetime.now().isoformat()
+        }
+        data = pickle.dumps(state_data, protocol=5)
+
+        temp_file = self.state_file.with_suffix(self.state_file.suffix + '.tmp')
+        with open(temp_file, 'wb') as f:
+            f.write(struct.pack('<I', len(data)))
+            f.write(data)
+            f.write(struct.pack('<I', zlib.crc32(data)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.state_file)
+
+        self._logged_batch_state = {
+            batch_num: snapshot
+            for batch_num, snapshot in (
+                (int(num), snap) for num, snap in state_data['batch_progress'].items()
+            )
+        }
+        self._deltas_since_compaction = 0
     
     def load_state(self) -> bool:
         """
@@ -278,9 +534,14 @@ class MainExecutionFlow:
                 self.logger.info("No previous execution state found")
                 return False
             
-            with open(self.state_file, 'r', encoding='utf-8') as f:
-                state_data = json.load(f)
-            
+            # Frames are replayed in order with last-write-wins per batch
+            frames = self._read_state_frames(self.state_file.read_bytes())
+
+            merged_batches: Dict[str, Dict[str, Any]] = {}
+            for frame in frames:
+                merged_batches.update(frame['batch_progress'])
+            state_data = frames[-1]
+
             # Restore progress
             progress_data = state_data['progress']
             self.progress.status = FlowStatus(progress_data['status'])
@@ -297,8 +558,7 @@ class MainExecutionFlow:
             self.progress.recovery_mode = progress_data['recovery_mode']
             
             # Restore batch progress
-            batch_progress_data = state_data['batch_progress']
-            for batch_num_str, batch_data in batch_progress_data.items():
+            for batch_num_str, batch_data in merged_batches.items():
                 batch_num = int(batch_num_str)
                 batch_progress = BatchProgress(
                     batch_number=batch_data['batch_number'],
@@ -315,7 +575,11 @@ class MainExecutionFlow:
                     max_retries=batch_data['max_retries']
                 )
                 self.progress.batch_progress[batch_num] = batch_progress
-            
+
+            self._logged_batch_state = {
+                int(num): snapshot for num, snapshot in merged_batches.items()
+            }
+
             self.logger.info(f"Execution state loaded from {state_data['saved_at']}")
             return True
             
@@ -323,13 +587,68 @@ class MainExecutionFlow:
             self.logger.error(f"Failed to load execution state: {e}")
             return False
     
-    def get_progress_report(self) -> Dict[str, Any]:
+    def _batch_report_entry(self, batch_progress: BatchProgress) -> Dict[str, Any]:
+        """Render the report fragment for one batch, reusing the cached dict
+        when none of its reported fields changed since the last poll.
+
+        Batch progress is mutated directly on the dataclass throughout the
+        flow (and by tests), so staleness is detected by comparing a cheap
+        tuple of the reported fields rather than relying on writers to mark
+        batches dirty.
         """
-        Get comprehensive progress report.
-        
-        Returns:
-            Dictionary containing detailed progress information
+        fingerprint = (
+            batch_progress.status,
+            batch_progress.questions_generated,
+            batch_progress.validation_score,
+            batch_progress.retry_count,
+            batch_progress.error_message
+        )
+        cached = self._batch_report_cache.get(batch_progress.batch_number)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        entry = {
+            'batch_number': batch_progress.batch_number,
+            'status': batch_progress.status.value,
+            'questions_generated': batch_progress.questions_generated,
+            'validation_score': round(batch_progress.validation_score, 2),
+            'retry_count': batch_progress.retry_count,
+            'error_message': batch_progress.error_message
+        }
+        self._batch_report_cache[batch_progress.batch_number] = (fingerprint, entry)
+        return entry
+
+    def load_resume_cursor(self) -> Optional[Dict[str, Any]]:
+        """Read only the resume cursor from the state file.
+
+        Recovery-mode startup and status probes usually need just the flow
+        status and which batches are already done; this reads the frames but
+        skips instantiating 19 BatchProgress objects and parsing their
+        timestamps. Returns a dict with 'status', 'completed_batches' and
+        'completed_bitmap', or None when no usable checkpoint exists.
         """
+        try:
+            if not self.state_file.exists():
+                return None
+
+            frames = self._read_state_frames(self.state_file.read_bytes())
+            if not frames:
+                return None
+
+            last_frame = frames[-1]
+            progress_data = last_frame['progress']
+            return {
+                'status': FlowStatus(progress_data['status']),
+                'completed_batches': progress_data['completed_batches'],
+                'completed_bitmap': last_frame.get('completed_bitmap', 0)
+            }
+
+        except Exception as e:
+            self.logger.error(f"Failed to read resume cursor: {e}")
+            return None
+
+    def _report_header(self) -> Dict[str, Any]:
+        """Build the flow-level fields of the progress report."""
         # Calculate overall progress percentage
         total_steps = self.progress.total_batches * 7  # 7 steps per batch
         completed_steps = sum(bp.steps_completed for bp in self.progress.batch_progress.values())
@@ -348,11 +667,12 @@ class MainExecutionFlow:
         # Get current batch info
         current_batch_info = None
         if self.progress.current_batch:
+            current = self.progress.batch_progress[self.progress.current_batch]
             current_batch_info = {
                 'batch_number': self.progress.current_batch,
-                'status': self.progress.batch_progress[self.progress.current_batch].status.value,
-                'current_step': self.progress.batch_progress[self.progress.current_batch].current_step,
-                'progress': f"{self.progress.batch_progress[self.progress.current_batch].steps_completed}/{self.progress.batch_progress[self.progress.current_batch].total_steps}"
+                'status': current.status.value,
+                'current_step': current.current_step,
+                'progress': f"{current.steps_completed}/{current.total_steps}"
             }
         
         return {
@@ -365,20 +685,54 @@ class MainExecutionFlow:
             'overall_validation_score': round(self.progress.overall_validation_score, 2),
             'current_batch': current_batch_info,
             'estimated_completion_time': estimated_completion.isoformat() if estimated_completion else None,
-            'elapsed_time': str(datetime.now() - self.progress.start_time) if self.progress.start_time else None,
-            'batch_details': [
-                {
-                    'batch_number': bp.batch_number,
-                    'status': bp.status.value,
-                    'questions_generated': bp.questions_generated,
-                    'validation_score': round(bp.validation_score, 2),
-                    'retry_count': bp.retry_count,
-                    'error_message': bp.error_message
-                }
-                for bp in self.progress.batch_progress.values()
-            ]
+            'elapsed_time': str(datetime.now() - self.progress.start_time) if self.progress.start_time else None
         }
-    
+
+    def get_progress_report(self) -> Dict[str, Any]:
+        """
+        Get comprehensive progress report.
+
+        Returns:
+            Dictionary containing detailed progress information
+        """
+        report = self._report_header()
+        # Hoist the bound method out of the hot loop; the fragments
+        # themselves come from the per-batch cache.
+        batch_entry = self._batch_report_entry
+        report['batch_details'] = [
+            batch_entry(bp) for bp in self.progress.batch_progress.values()
+        ]
+        return report
+
+    def write_progress_report(self, fp) -> None:
+        """Stream the progress report as compact JSON to a binary file object.
+
+        Serializes the header fields and the cached per-batch fragments
+        piecewise instead of materializing the whole report dict and one
+        large JSON string, which keeps the realtime polling path cheap.
+        """
+        dumps = json.dumps
+        fp.write(b'{')
+        for key, value in self._report_header().items():
+            fp.write(dumps(key).encode('utf-8'))
+            fp.write(b':')
+            fp.write(dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+            fp.write(b',')
+        fp.write(b'"batch_details":[')
+        first = True
+        for bp in self.progress.batch_progress.values():
+            if not first:
+                fp.write(b',')
+            fp.write(
+                dumps(
+                    self._batch_report_entry(bp),
+                    ensure_ascii=False,
+                    separators=(',', ':')
+                ).encode('utf-8')
+            )
+            first = False
+        fp.write(b']}')
+
     async def initialize_flow(self) -> ExamGuideAnalysis:
         """
         Initialize the execution flow by analyzing the exam guide.
@@ -400,8 +754,12 @@ class MainExecutionFlow:
             if not exam_guide_path.exists():
                 raise QuestionGenerationError(f"Exam guide not found: {exam_guide_path}")
             
-            with open(exam_guide_path, 'r', encoding='utf-8') as f:
-                exam_guide_content = f.read()
+            # Memory-map the guide so pages are faulted in on demand rather
+            # than copied through a read buffer; decode happens once here
+            # because the analysis prompt needs str.
+            with open(exam_guide_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    exam_guide_content = mm[:].decode('utf-8')
             
             self.logger.info("📋 Analyzing exam guide with AI...")
             
@@ -430,7 +788,7 @@ class MainExecutionFlow:
             
             self.logger.info("✅ Exam guide analysis completed")
             self.logger.info(f"   📊 Domains: {len(exam_analysis.domains)}")
-            self.logger.info(f"   🎯 Target questions: {exam_analysis.target_total_questions}")
+            self.logger.info(f"   🎯 Target questions: {exam_analysis.total_questions}")
             
             return exam_analysis
             
@@ -465,7 +823,7 @@ class MainExecutionFlow:
         try:
             self.logger.info(f"🔄 Processing batch {batch_number}/19...")
             batch_progress.status = BatchStatus.ANALYZING
-            batch_progress.start_time = datetime.now()
+            batch_progress.start_ns = time.monotonic_ns()
             batch_progress.current_step = "Initializing workflow"
             self.save_state()
             
@@ -480,7 +838,7 @@ class MainExecutionFlow:
             
             # Mark batch as completed
             batch_progress.status = BatchStatus.COMPLETED
-            batch_progress.end_time = datetime.now()
+            batch_progress.end_ns = time.monotonic_ns()
             batch_progress.steps_completed = batch_progress.total_steps
             batch_progress.integration_result = integration_result
             
@@ -527,7 +885,7 @@ class MainExecutionFlow:
         # Step 1: Analyze current state and plan batch
         batch_progress.current_step = "Analyzing current state"
         batch_progress.status = BatchStatus.ANALYZING
-        self.save_state()
+        self.request_save()
         
         # Load current database state
         database_state = await self._get_current_database_state()
@@ -557,54 +915,54 @@ class MainExecutionFlow:
         )
         
         batch_progress.steps_completed = 1
-        self.save_state()
+        self.request_save()
         
         # Step 2: Research AWS knowledge
         batch_progress.current_step = "Researching AWS knowledge"
         batch_progress.status = BatchStatus.RESEARCHING
-        self.save_state()
+        self.request_save()
         
         aws_knowledge = await self._research_aws_knowledge(batch_plan)
         
         batch_progress.steps_completed = 2
-        self.save_state()
+        self.request_save()
         
         # Step 3: Generate questions
         batch_progress.current_step = "Generating questions"
         batch_progress.status = BatchStatus.GENERATING
-        self.save_state()
+        self.request_save()
         
         question_batch = await self._generate_questions(batch_plan, aws_knowledge)
         batch_progress.questions_generated = len(question_batch.questions)
         
         batch_progress.steps_completed = 3
-        self.save_state()
+        self.request_save()
         
         # Step 4: Validate quality
         batch_progress.current_step = "Validating quality"
         batch_progress.status = BatchStatus.VALIDATING
-        self.save_state()
+        self.request_save()
         
         validation_result = await self._validate_questions(question_batch)
         batch_progress.validation_score = validation_result.overall_score
         
         batch_progress.steps_completed = 4
-        self.save_state()
+        self.request_save()
         
         # Step 5: Optimize Japanese (optional step)
         batch_progress.current_step = "Optimizing Japanese"
         batch_progress.status = BatchStatus.OPTIMIZING
-        self.save_state()
+        self.request_save()
         
         optimized_batch = await self._optimize_japanese(question_batch)
         
         batch_progress.steps_completed = 5
-        self.save_state()
+        self.request_save()
         
         # Step 6: Integrate into database
         batch_progress.current_step = "Integrating into database"
         batch_progress.status = BatchStatus.INTEGRATING
-        self.save_state()
+        self.request_save()
         
         integration_result = self.db_integration_agent.integrate_batch_with_structured_output(
             optimized_batch,
@@ -612,7 +970,7 @@ class MainExecutionFlow:
         )
         
         batch_progress.steps_completed = 6
-        self.save_state()
+        self.request_save()
         
         return integration_result
     
@@ -718,62 +1076,74 @@ class MainExecutionFlow:
             if self.load_state() and self.progress.status in [FlowStatus.PAUSED, FlowStatus.RUNNING]:
                 self.logger.info("📂 Resuming from previous state...")
                 self.progress.recovery_mode = True
+                exam_analysis = getattr(self, 'exam_analysis', None)
+                if exam_analysis is None:
+                    exam_analysis = await self.initialize_flow()
             else:
                 # Initialize new flow
                 exam_analysis = await self.initialize_flow()
-            
+
             self.progress.status = FlowStatus.RUNNING
             self.save_state()
-            
-            # Process batches 1-19
+
+            # Collect pending batches, skipping completed ones in recovery mode
+            pending_batches = []
             for batch_number in range(1, 20):
-                # Check for pause request
-                if self.progress.pause_requested:
-                    self.logger.info("⏸️ Pause requested, stopping execution...")
-                    self.progress.status = FlowStatus.PAUSED
-                    self.save_state()
-                    return None
-                
-                # Skip completed batches in recovery mode
-                if (self.progress.recovery_mode and 
+                if (self.progress.recovery_mode and
                     self.progress.batch_progress[batch_number].status == BatchStatus.COMPLETED):
                     self.logger.info(f"⏭️ Skipping completed batch {batch_number}")
                     continue
-                
-                self.progress.current_batch = batch_number
-                
-                try:
-                    # Process batch with retry logic
-                    batch_progress = self.progress.batch_progress[batch_number]
-                    
-                    if batch_progress.retry_count < batch_progress.max_retries:
-                        if not hasattr(self, 'exam_analysis'):
-                            # Re-initialize if needed
-                            exam_analysis = await self.initialize_flow()
-                        
-                        integration_result = await self.process_batch_with_workflow(
-                            batch_number, exam_analysis
-                        )
-                        
-                        self.logger.info(f"✅ Batch {batch_number} completed: {integration_result.questions_added} questions added")
-                    
-                    else:
-                        self.logger.error(f"❌ Batch {batch_number} failed after {batch_progress.max_retries} retries")
+                pending_batches.append(batch_number)
+
+            # Process batches concurrently: each batch is dominated by remote
+            # agent latency, so overlapping up to max_parallel_batches of them
+            # cuts wall-clock time without extra CPU cost.
+            semaphore = asyncio.Semaphore(max(1, self.max_parallel_batches))
+
+            async def process_one_batch(batch_number: int) -> None:
+                async with semaphore:
+                    # Check for pause request before starting new work
+                    if self.progress.pause_requested:
+                        return
+
+                    self.progress.current_batch = batch_number
+
+                    try:
+                        # Process batch with retry logic
+                        batch_progress = self.progress.batch_progress[batch_number]
+
+                        if batch_progress.retry_count < batch_progress.max_retries:
+                            integration_result = await self.process_batch_with_workflow(
+                                batch_number, exam_analysis
+                            )
+
+                            self.logger.info(f"✅ Batch {batch_number} completed: {integration_result.questions_added} questions added")
+
+                        else:
+                            self.logger.error(f"❌ Batch {batch_number} failed after {batch_progress.max_retries} retries")
+                            batch_progress.status = BatchStatus.FAILED
+                            self.progress.failed_batches += 1
+
+                    except Exception as e:
+                        self.logger.error(f"❌ Batch {batch_number} failed: {e}")
+                        batch_progress = self.progress.batch_progress[batch_number]
                         batch_progress.status = BatchStatus.FAILED
+                        batch_progress.error_message = str(e)
                         self.progress.failed_batches += 1
-                
-                except Exception as e:
-                    self.logger.error(f"❌ Batch {batch_number} failed: {e}")
-                    batch_progress = self.progress.batch_progress[batch_number]
-                    batch_progress.status = BatchStatus.FAILED
-                    batch_progress.error_message = str(e)
-                    self.progress.failed_batches += 1
-                
+
+                    self.save_state()
+
+                    # Log progress
+                    progress_report = self.get_progress_report()
+                    self.logger.info(f"📊 Overall progress: {progress_report['overall_progress_percentage']:.1f}%")
+
+            await asyncio.gather(*(process_one_batch(batch_number) for batch_number in pending_batches))
+
+            if self.progress.pause_requested:
+                self.logger.info("⏸️ Pause requested, stopping execution...")
+                self.progress.status = FlowStatus.PAUSED
                 self.save_state()
-                
-                # Log progress
-                progress_report = self.get_progress_report()
-                self.logger.info(f"📊 Overall progress: {progress_report['overall_progress_percentage']:.1f}%")
+                return None
             
             # Complete the flow
             self.progress.status = FlowStatus.COMPLETED
@@ -822,18 +1192,24 @@ class MainExecutionFlow:
     
     def get_real_time_status(self) -> Dict[str, Any]:
         """Get real-time status for monitoring."""
+        status_counts = self.progress.batch_progress.status_counts()
         return {
             'timestamp': datetime.now().isoformat(),
             'status': self.progress.status.value,
+            'batch_status_counts': {
+                status.value: count for status, count in status_counts.items()
+            },
             'progress': self.get_progress_report(),
             'system_health': {
                 'agents_initialized': {
-                    'exam_analyzer': self._exam_analyzer is not None,
-                    'batch_manager': self._batch_manager is not None,
-                    'aws_knowledge_agent': self._aws_knowledge_agent is not None,
-                    'question_generator': self._question_generator is not None,
-                    'quality_validator': self._quality_validator is not None,
-                    'db_integration_agent': self._db_integration_agent is not None
+                    # cached_property stores created agents in the instance
+                    # dict under the accessor name
+                    'exam_analyzer': 'exam_analyzer' in self.__dict__,
+                    'batch_manager': 'batch_manager' in self.__dict__,
+                    'aws_knowledge_agent': 'aws_knowledge_agent' in self.__dict__,
+                    'question_generator': 'question_generator' in self.__dict__,
+                    'quality_validator': 'quality_validator' in self.__dict__,
+                    'db_integration_agent': 'db_integration_agent' in self.__dict__
                 },
                 'database_accessible': self.database_path.exists(),
                 'backup_dir_accessible': self.backup_dir.exists()
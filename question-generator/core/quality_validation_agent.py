@@ -7,8 +7,10 @@ It validates technical accuracy, clarity, difficulty appropriateness, and
 overall question quality.
 """
 
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import FrozenSet, Iterable, List, Dict, Any, Optional
 import json
 from datetime import datetime
 
@@ -17,7 +19,9 @@ from strands import Agent
 
 # Local imports
 from models.question_models import Question, QuestionBatch
-from models.validation_models import QuestionValidation, BatchValidation
+from models.validation_models import (
+    QuestionValidation, QuestionValidationList, BatchValidation
+)
 from core.agent_factory import AgentFactory
 from core.error_handling import ValidationError, retry_with_backoff
 from config import AgentConfig
@@ -33,7 +37,11 @@ class QualityValidationAgent:
     quality assessment including technical accuracy, clarity, difficulty
     appropriateness, and Japanese language quality.
     """
-    
+
+    # Minimum word-overlap (Jaccard) similarity for two questions to be
+    # flagged as duplicates
+    DUPLICATE_SIMILARITY_THRESHOLD = 0.8
+
     def __init__(self, config: AgentConfig):
         """
         Initialize the quality validation agent.
@@ -45,7 +53,19 @@ class QualityValidationAgent:
         self.agent_factory = AgentFactory(config)
         self.validator_agent: Optional[Agent] = None
         self.aws_knowledge_agent = None
-        
+
+        # LRU cache of tokenized question texts keyed by text hash, so
+        # repeated duplicate checks against the same existing questions
+        # don't re-tokenize them on every candidate
+        self._word_set_cache: "OrderedDict[str, FrozenSet[str]]" = OrderedDict()
+        self._word_set_cache_max_size = 5000
+
+        # LRU cache of inverted word indexes keyed by the id sequence of
+        # an existing-question list, so re-scanning the same corpus for
+        # several candidates reuses one index
+        self._word_index_cache: "OrderedDict[tuple, Dict[str, List[int]]]" = OrderedDict()
+        self._word_index_cache_max_size = 32
+
         logger.info("QualityValidationAgent initialized")
     
     def _get_validator_agent(self) -> Agent:
@@ -319,6 +339,157 @@ class QualityValidationAgent:
             logger.error(error_msg)
             raise ValidationError(error_msg) from e
     
+    @retry_with_backoff(max_retries=3, base_delay=3.0)
+    def validate_batches(
+        self,
+        question_batches: List[QuestionBatch],
+        aws_docs_context: Optional[str] = None
+    ) -> List[BatchValidation]:
+        """
+        Validate multiple batches of questions in a single agent request.
+
+        All questions from all batches are concatenated into one structured
+        prompt, validated in a single LLM round trip instead of one call per
+        question, and the per-question results are split back into per-batch
+        BatchValidation objects.
+
+        Args:
+            question_batches: Batches of questions to validate
+            aws_docs_context: Optional AWS documentation context
+
+        Returns:
+            List of BatchValidation results, one per input batch
+
+        Raises:
+            ValidationError: If batched validation fails
+        """
+        try:
+            all_questions = [
+                question
+                for question_batch in question_batches
+                for question in question_batch.questions
+            ]
+            logger.info(
+                f"Validating {len(question_batches)} batches "
+                f"({len(all_questions)} questions) in a single request"
+            )
+
+            if aws_docs_context is None:
+                aws_docs_context = "No specific AWS documentation context available."
+
+            validation_prompt = self._create_multi_question_validation_prompt(
+                all_questions, aws_docs_context
+            )
+
+            validator_agent = self._get_validator_agent()
+            mcp_context = self.agent_factory.get_mcp_context_manager()
+
+            with mcp_context:
+                validation_list = validator_agent.structured_output(
+                    QuestionValidationList,
+                    validation_prompt
+                )
+
+            if len(validation_list.validations) != len(all_questions):
+                raise ValidationError(
+                    f"Expected {len(all_questions)} question validations, "
+                    f"got {len(validation_list.validations)}"
+                )
+
+            # Split the flat validation list back into per-batch results
+            batch_validations = []
+            cursor = 0
+            for question_batch in question_batches:
+                question_validations = validation_list.validations[
+                    cursor:cursor + len(question_batch.questions)
+                ]
+                cursor += len(question_batch.questions)
+                batch_validations.append(
+                    self._validate_batch_level_requirements(
+                        question_batch, question_validations
+                    )
+                )
+
+            logger.info(
+                f"Batched validation completed - approved batches: "
+                f"{sum(1 for bv in batch_validations if bv.batch_approved)}/{len(batch_validations)}"
+            )
+
+            return batch_validations
+
+        except Exception as e:
+            error_msg = f"Failed to validate {len(question_batches)} batches: {str(e)}"
+            logger.error(error_msg)
+            raise ValidationError(error_msg) from e
+
+    def _create_multi_question_validation_prompt(
+        self,
+        questions: List[Question],
+        aws_docs_context: str
+    ) -> str:
+        """
+        Create a validation prompt covering multiple questions at once.
+
+        Args:
+            questions: Questions to validate
+            aws_docs_context: AWS documentation context
+
+        Returns:
+            Validation prompt string
+        """
+        question_sections = []
+        for index, question in enumerate(questions, start=1):
+            question_sections.append(f"""### 問題 {index}
+
+**問題ID**: {question.id}
+**ドメイン**: {question.domain}
+**難易度**: {question.difficulty}
+**問題タイプ**: {question.type}
+
+**問題文**:
+{question.question}
+
+**選択肢**:
+{chr(10).join([f"{chr(65+i)}. {option}" for i, option in enumerate(question.options)])}
+
+**正解**: {question.correct_answer}
+
+**解説**:
+{question.explanation}
+
+**学習リソース**:
+{chr(10).join([f"- {resource.title} ({resource.type}): {resource.url}" for resource in question.learning_resources])}
+
+**関連AWSサービス**: {', '.join(question.related_services)}
+""")
+
+        return f"""
+以下の{len(questions)}問のAWS CloudOps試験問題をまとめて検証してください。
+
+## 検証対象問題
+
+{chr(10).join(question_sections)}
+
+## AWS公式ドキュメント参照
+
+{aws_docs_context}
+
+## 検証項目
+
+各問題について、技術的正確性、問題の明確性、難易度の適切性、
+誤答選択肢の品質、解説の包括性、学習リソースの有効性、日本語品質、
+AWS試験関連性を詳細に検証してください。
+
+## 出力要件
+
+問題ごとに構造化された検証結果を、入力と同じ順序で提供してください。
+各結果には問題IDを正確に記載し、具体的な問題点の指摘、改善提案、
+総合評価スコア、承認可否の判定を含めてください。
+
+検証は厳格に行い、技術的正確性を最優先してください。
+疑わしい点があれば、AWS公式ドキュメントとの照合を重視してください。
+"""
+
     def _validate_batch_level_requirements(
         self,
         question_batch: QuestionBatch,
@@ -503,17 +674,36 @@ class QualityValidationAgent:
         try:
             logger.info(f"Checking question {new_question.id} against {len(existing_questions)} existing questions")
             
-            # Simple text similarity check
+            # Text similarity check via the inverted word index: shared
+            # word counts come from bucket lookups, so only questions
+            # that actually overlap the candidate are scored
+            threshold = self.DUPLICATE_SIMILARITY_THRESHOLD
+            new_words = self._get_word_set(new_question.question)
+
+            word_index = self._get_word_index(existing_questions)
+            shared_counts: Dict[int, int] = {}
+            for word in new_words:
+                for index in word_index.get(word, ()):
+                    shared_counts[index] = shared_counts.get(index, 0) + 1
+
             similar_questions = []
-            for existing in existing_questions:
-                # Check question text similarity (simplified)
-                if self._calculate_text_similarity(new_question.question, existing.question) > 0.8:
+            for index in sorted(shared_counts):
+                existing = existing_questions[index]
+                shared = shared_counts[index]
+                union_size = (
+                    len(new_words)
+                    + len(self._get_word_set(existing.question))
+                    - shared
+                )
+                similarity = shared / union_size if union_size else 0.0
+                if similarity > threshold:
                     similar_questions.append({
                         'id': existing.id,
-                        'similarity': self._calculate_text_similarity(new_question.question, existing.question),
+                        'similarity': similarity,
                         'reason': 'Similar question text'
                     })
-                
+
+            for existing in existing_questions:
                 # Check if same AWS services and domain
                 if (new_question.domain == existing.domain and 
                     set(new_question.related_services) == set(existing.related_services) and
@@ -538,144 +728,243 @@ class QualityValidationAgent:
                 'recommendation': 'Duplicate check failed - manual review recommended'
             }
     
+    def _get_word_set(self, text: str) -> FrozenSet[str]:
+        """
+        Tokenize text into a word set, with LRU caching.
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            Frozen set of lowercased words
+        """
+        cache_key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+        words = self._word_set_cache.get(cache_key)
+        if words is not None:
+            self._word_set_cache.move_to_end(cache_key)
+            return words
+
+        words = frozenset(text.lower().split())
+        self._word_set_cache[cache_key] = words
+        if len(self._word_set_cache) > self._word_set_cache_max_size:
+            self._word_set_cache.popitem(last=False)
+
+        return words
+
+    def _get_word_index(self, questions: List[Question]) -> Dict[str, List[int]]:
+        """
+        Build an inverted word-to-position index for a question list, with LRU caching.
+
+        Args:
+            questions: Questions to index
+
+        Returns:
+            Mapping from word to list of question positions containing it
+        """
+        cache_key = tuple(question.id for question in questions)
+
+        word_index = self._word_index_cache.get(cache_key)
+        if word_index is not None:
+            self._word_index_cache.move_to_end(cache_key)
+            return word_index
+
+        word_index = {}
+        for position, question in enumerate(questions):
+            for word in self._get_word_set(question.question):
+                word_index.setdefault(word, []).append(position)
+
+        self._word_index_cache[cache_key] = word_index
+        if len(self._word_index_cache) > self._word_index_cache_max_size:
+            self._word_index_cache.popitem(last=False)
+
+        return word_index
+
     def _calculate_text_similarity(self, text1: str, text2: str) -> float:
         """
         Calculate simple text similarity between two strings.
-        
+
         Args:
             text1: First text
             text2: Second text
-        
+
         Returns:
             Similarity score between 0 and 1
         """
         # Simple word-based similarity (could be enhanced with more sophisticated methods)
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
+        return self._jaccard_similarity(
+            self._get_word_set(text1), self._get_word_set(text2)
+        )
+
+    @staticmethod
+    def _jaccard_similarity(words1: FrozenSet[str], words2: FrozenSet[str]) -> float:
+        """
+        Calculate Jaccard similarity between two word sets.
+
+        Args:
+            words1: First word set
+            words2: Second word set
+
+        Returns:
+            Similarity score between 0 and 1
+        """
         if not words1 or not words2:
             return 0.0
-        
+
         intersection = words1.intersection(words2)
         union = words1.union(words2)
-        
+
         return len(intersection) / len(union) if union else 0.0
     
     def generate_quality_report(
         self,
-        batch_validations: List[BatchValidation]
+        batch_validations: Iterable[BatchValidation]
     ) -> Dict[str, Any]:
         """
         Generate a comprehensive quality report from multiple batch validations.
-        
+
+        The validations are consumed in a single pass with running
+        aggregates, so a generator (e.g. streaming results back from a
+        JSONL file) works as well as a list and peak memory stays
+        bounded by one batch.
+
         Args:
-            batch_validations: List of batch validation results
-        
+            batch_validations: Iterable of batch validation results
+
         Returns:
             Comprehensive quality report
         """
         try:
-            logger.info(f"Generating quality report for {len(batch_validations)} batches")
-            
-            # Aggregate statistics
-            total_questions = sum(len(bv.question_validations) for bv in batch_validations)
-            total_approved = sum(
-                sum(1 for qv in bv.question_validations if qv.approved) 
-                for bv in batch_validations
-            )
-            
-            # Calculate average scores
-            all_question_validations = []
+            # Running aggregates over the single pass
+            total_batches = 0
+            total_questions = 0
+            total_approved = 0
+            overall_score_sum = 0
+            technical_accurate_count = 0
+            japanese_quality_sum = 0
+            approved_batches = 0
+            first_batch_score = None
+            last_batch_score = None
+            common_issues: Dict[str, int] = {}
+            batch_details = []
+            quality_metrics = {
+                'high_quality_batches': 0,
+                'medium_quality_batches': 0,
+                'low_quality_batches': 0,
+                'batches_needing_revision': 0
+            }
+
             for bv in batch_validations:
-                all_question_validations.extend(bv.question_validations)
-            
-            avg_overall_score = sum(qv.overall_score for qv in all_question_validations) / len(all_question_validations)
-            avg_technical_accuracy = sum(1 for qv in all_question_validations if qv.technical_accuracy) / len(all_question_validations)
-            avg_japanese_quality = sum(qv.japanese_quality for qv in all_question_validations) / len(all_question_validations)
-            
-            # Domain distribution
-            domain_counts = {}
-            for qv in all_question_validations:
-                # Note: This would need actual question data to get domain
-                pass  # Simplified for now
-            
+                total_batches += 1
+                total_questions += len(bv.question_validations)
+
+                batch_approved_questions = 0
+                batch_issues_count = 0
+                for qv in bv.question_validations:
+                    if qv.approved:
+                        batch_approved_questions += 1
+                    overall_score_sum += qv.overall_score
+                    if qv.technical_accuracy:
+                        technical_accurate_count += 1
+                    japanese_quality_sum += qv.japanese_quality
+                    batch_issues_count += len(qv.issues)
+                total_approved += batch_approved_questions
+
+                batch_details.append({
+                    'batch_number': bv.batch_number,
+                    'batch_score': bv.batch_quality_score,
+                    'approved': bv.batch_approved,
+                    'approved_questions': batch_approved_questions,
+                    'issues_count': batch_issues_count
+                })
+
+                if bv.batch_quality_score >= 85:
+                    quality_metrics['high_quality_batches'] += 1
+                elif bv.batch_quality_score >= 70:
+                    quality_metrics['medium_quality_batches'] += 1
+                else:
+                    quality_metrics['low_quality_batches'] += 1
+                if not bv.batch_approved:
+                    quality_metrics['batches_needing_revision'] += 1
+
+                if bv.batch_approved:
+                    approved_batches += 1
+                for fix in bv.required_fixes:
+                    common_issues[fix] = common_issues.get(fix, 0) + 1
+                if first_batch_score is None:
+                    first_batch_score = bv.batch_quality_score
+                last_batch_score = bv.batch_quality_score
+
+            logger.info(f"Generating quality report for {total_batches} batches")
+
             # Generate report
             quality_report = {
                 'report_generated_at': datetime.now().isoformat(),
                 'summary': {
-                    'total_batches': len(batch_validations),
+                    'total_batches': total_batches,
                     'total_questions': total_questions,
                     'approved_questions': total_approved,
                     'approval_rate': total_approved / total_questions if total_questions > 0 else 0,
-                    'average_overall_score': round(avg_overall_score, 2),
-                    'technical_accuracy_rate': round(avg_technical_accuracy, 2),
-                    'average_japanese_quality': round(avg_japanese_quality, 2)
+                    'average_overall_score': round(overall_score_sum / total_questions, 2),
+                    'technical_accuracy_rate': round(technical_accurate_count / total_questions, 2),
+                    'average_japanese_quality': round(japanese_quality_sum / total_questions, 2)
                 },
-                'batch_details': [
-                    {
-                        'batch_number': bv.batch_number,
-                        'batch_score': bv.batch_quality_score,
-                        'approved': bv.batch_approved,
-                        'approved_questions': sum(1 for qv in bv.question_validations if qv.approved),
-                        'issues_count': sum(len(qv.issues) for qv in bv.question_validations)
-                    }
-                    for bv in batch_validations
-                ],
-                'recommendations': self._generate_overall_recommendations(batch_validations),
-                'quality_metrics': {
-                    'high_quality_batches': sum(1 for bv in batch_validations if bv.batch_quality_score >= 85),
-                    'medium_quality_batches': sum(1 for bv in batch_validations if 70 <= bv.batch_quality_score < 85),
-                    'low_quality_batches': sum(1 for bv in batch_validations if bv.batch_quality_score < 70),
-                    'batches_needing_revision': sum(1 for bv in batch_validations if not bv.batch_approved)
-                }
+                'batch_details': batch_details,
+                'recommendations': self._generate_overall_recommendations(
+                    total_batches=total_batches,
+                    approved_batches=approved_batches,
+                    common_issues=common_issues,
+                    first_batch_score=first_batch_score,
+                    last_batch_score=last_batch_score
+                ),
+                'quality_metrics': quality_metrics
             }
-            
+
             logger.info(f"Quality report generated - Approval rate: {quality_report['summary']['approval_rate']:.2%}")
             return quality_report
-            
+
         except Exception as e:
             logger.error(f"Failed to generate quality report: {e}")
             raise ValidationError(f"Quality report generation failed: {str(e)}") from e
-    
+
     def _generate_overall_recommendations(
         self,
-        batch_validations: List[BatchValidation]
+        total_batches: int,
+        approved_batches: int,
+        common_issues: Dict[str, int],
+        first_batch_score: Optional[int],
+        last_batch_score: Optional[int]
     ) -> List[str]:
         """
-        Generate overall recommendations based on all batch validations.
-        
+        Generate overall recommendations from aggregated batch statistics.
+
         Args:
-            batch_validations: List of batch validation results
-        
+            total_batches: Number of batches validated
+            approved_batches: Number of approved batches
+            common_issues: Count of required fixes across batches
+            first_batch_score: Quality score of the first batch
+            last_batch_score: Quality score of the last batch
+
         Returns:
             List of overall recommendations
         """
         recommendations = []
-        
+
         # Check overall approval rate
-        total_batches = len(batch_validations)
-        approved_batches = sum(1 for bv in batch_validations if bv.batch_approved)
         approval_rate = approved_batches / total_batches if total_batches > 0 else 0
-        
+
         if approval_rate < 0.8:
             recommendations.append(f"バッチ承認率が{approval_rate:.1%}と低いため、品質向上プロセスの見直しが必要")
-        
+
         # Check for common issues across batches
-        common_issues = {}
-        for bv in batch_validations:
-            for fix in bv.required_fixes:
-                common_issues[fix] = common_issues.get(fix, 0) + 1
-        
         for issue, count in common_issues.items():
             if count > total_batches * 0.3:  # If issue appears in >30% of batches
                 recommendations.append(f"共通課題: {issue} ({count}バッチで発生)")
-        
+
         # Check quality trends
-        avg_scores = [bv.batch_quality_score for bv in batch_validations]
-        if len(avg_scores) > 1:
-            if avg_scores[-1] < avg_scores[0]:  # Quality declining
-                recommendations.append("品質スコアの低下傾向が見られます - プロセス改善を検討してください")
-        
+        if total_batches > 1 and last_batch_score < first_batch_score:  # Quality declining
+            recommendations.append("品質スコアの低下傾向が見られます - プロセス改善を検討してください")
+
         return recommendations
     
     def cleanup(self):
@@ -6,8 +6,10 @@ high-quality AWS CloudOps exam questions using advanced prompt engineering
 techniques and structured output generation.
 """
 
+import hashlib
 import json
 import logging
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
@@ -45,6 +47,12 @@ class QuestionGenerationAgent:
         self.bedrock_model = None
         self.mcp_client = None
         self.agents = {}
+        # Memoized generation prompts, keyed on the inputs that shape
+        # them; retries of the same (type, count, batch, content) tuple
+        # reuse the built string, and the identical prefix also keeps
+        # Bedrock prompt caching effective across retries.
+        self._prompt_cache: OrderedDict[tuple, str] = OrderedDict()
+        self._prompt_cache_max_size = 64
         self._setup_logging()
         self._initialize_components()
     
@@ -460,25 +468,62 @@ AWS Knowledge MCP Serverを活用して最新のトラブルシューティン
         aws_knowledge_content: str,
         existing_questions: List[Question] = None
     ) -> str:
-        """Create a detailed generation prompt for the specified question type."""
-        
-        # Base prompt structure
+        """Create a detailed generation prompt for the specified question type.
+
+        Prompts are memoized per (type, count, batch, content) so retries
+        rebuild nothing and send Bedrock a byte-identical prompt. Calls
+        carrying existing_questions bypass the cache because that list
+        grows as the batch fills in.
+        """
+        cache_key = None
+        if not existing_questions:
+            content_digest = hashlib.blake2b(
+                aws_knowledge_content[:3000].encode('utf-8'), digest_size=16
+            ).hexdigest()
+            cache_key = (
+                question_type, count, batch_plan.batch_number,
+                batch_plan.target_domain, content_digest
+            )
+            cached = self._prompt_cache.get(cache_key)
+            if cached is not None:
+                self._prompt_cache.move_to_end(cache_key)
+                return cached
+
+        prompt = self._build_generation_prompt(
+            question_type, count, batch_plan, aws_knowledge_content,
+            existing_questions
+        )
+
+        if cache_key is not None:
+            self._prompt_cache[cache_key] = prompt
+            if len(self._prompt_cache) > self._prompt_cache_max_size:
+                self._prompt_cache.popitem(last=False)
+
+        return prompt
+
+    def _build_generation_prompt(
+        self,
+        question_type: str,
+        count: int,
+        batch_plan: BatchPlan,
+        aws_knowledge_content: str,
+        existing_questions: List[Question] = None
+    ) -> str:
+        """Assemble the prompt text for _create_generation_prompt.
+
+        The static requirement blocks come first and the per-batch
+        context last, so prompts for one question type share a stable
+        prefix that model-provider prompt caching can match on.
+        """
+
+        # Base prompt structure; the intro is static so the prompt
+        # prefix stays identical across counts and batches
         prompt_parts = [
-            f"以下の情報に基づいて、AWS CloudOps試験問題を{count}問生成してください：",
-            "",
-            "## バッチ計画情報",
-            f"バッチ番号: {batch_plan.batch_number}",
-            f"対象ドメイン: {batch_plan.target_domain}",
-            f"対象難易度: {', '.join(batch_plan.target_difficulties)}",
-            f"対象トピック: {', '.join(batch_plan.priority_topics)}",
-            f"優先AWSサービス: {', '.join(batch_plan.priority_services)}",
-            "",
-            "## AWS知識コンテンツ",
-            aws_knowledge_content[:3000] + "..." if len(aws_knowledge_content) > 3000 else aws_knowledge_content,
+            "以下の要件と情報に基づいて、AWS CloudOps試験問題を生成してください：",
             "",
             "## 問題生成要件",
         ]
-        
+
         # Add type-specific requirements
         if question_type == 'scenario':
             prompt_parts.extend([
@@ -529,6 +574,17 @@ AWS Knowledge MCP Serverを活用して最新のトラブルシューティン
             "- 包括的な解説と学習リソース",
             "- 関連するAWSサービスの明記",
             "",
+            "## バッチ計画情報",
+            f"バッチ番号: {batch_plan.batch_number}",
+            f"対象ドメイン: {batch_plan.target_domain}",
+            f"対象難易度: {', '.join(batch_plan.target_difficulties)}",
+            f"対象トピック: {', '.join(batch_plan.priority_topics)}",
+            f"優先AWSサービス: {', '.join(batch_plan.priority_services)}",
+            f"生成する問題数: {count}問",
+            "",
+            "## AWS知識コンテンツ",
+            aws_knowledge_content[:3000] + "..." if len(aws_knowledge_content) > 3000 else aws_knowledge_content,
+            "",
             "## 重複回避"
         ])
         
@@ -1,7 +1,7 @@
 # Pydantic models for AWS CloudOps question generation system
 from .exam_guide_models import ExamGuideAnalysis, DomainAnalysis, Task, Skill
 from .question_models import Question, QuestionBatch, LearningResource
-from .validation_models import QuestionValidation, BatchValidation
+from .validation_models import QuestionValidation, QuestionValidationList, BatchValidation
 from .batch_models import DatabaseState, BatchPlan, ProgressReport
 from .integration_models import QuestionDatabase, IntegrationResult, DatabaseBackup
 from .aws_knowledge_models import (
@@ -24,6 +24,7 @@ __all__ = [
     
     # Quality validation models
     "QuestionValidation",
+    "QuestionValidationList",
     "BatchValidation",
     
     # Batch management models
@@ -128,6 +128,14 @@ class QuestionValidation(BaseModel):
         self.approved = self.overall_score >= 70 and self.technical_accuracy
 
 
+class QuestionValidationList(BaseModel):
+    """Structured output container for validating multiple questions at once."""
+
+    validations: List[QuestionValidation] = Field(
+        description="Validation results, one per question, in the same order as the input questions"
+    )
+
+
 class BatchValidation(BaseModel):
     """Validation result for a complete batch of questions."""
     
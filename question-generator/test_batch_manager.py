@@ -11,6 +11,8 @@ import logging
 from pathlib import Path
 from datetime import datetime
 
+import pytest
+
 from core.batch_manager import BatchManagerAgent
 from core.agent_factory import AgentFactory
 from models.batch_models import DatabaseState, BatchPlan, ProgressReport
@@ -25,6 +27,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# These tests drive real AgentFactory/Bedrock agents and write mock
+# question files, so they are deselected by default; opt in with
+# `pytest -m integration`.
+pytestmark = pytest.mark.integration
+
 
 async def create_mock_questions_file() -> Path:
     """Create a mock questions.json file for testing."""
@@ -7,10 +7,10 @@ settings.
 """
 
 import pytest
+import copy
 import json
+import logging
 import yaml
-import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -18,23 +18,48 @@ from unittest.mock import Mock, patch
 from core.configuration_manager import (
     ConfigurationManager, DomainConfiguration, BatchConfiguration,
     AgentConfiguration, QualityConfiguration, DatabaseConfiguration,
-    MonitoringConfiguration, ExecutionConfiguration,
+    MonitoringConfiguration, ExecutionConfiguration, ValidationIssue,
     LogLevel, ExecutionMode, BatchStrategy
 )
 from config import AgentConfig
 
 
+class CollectingHandler(logging.Handler):
+    """Logging handler that collects emitted records in a list."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
 class TestConfigurationManager:
     """Test cases for Configuration Manager."""
     
+    @pytest.fixture(scope="session")
+    def session_config_manager(self, tmp_path_factory):
+        """Build a pristine ConfigurationManager once per session.
+
+        Constructing the manager builds all default configurations, so
+        tests that only need an initialized manager share this instance
+        via deepcopy instead of paying that cost each time.
+        """
+        config_dir = tmp_path_factory.mktemp("session_config")
+        return ConfigurationManager(
+            str(config_dir / "config.yaml"), persist_defaults=False
+        )
+
     @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-    
-    @pytest.fixture
+    def config_manager(self, session_config_manager, tmp_path):
+        """Provide a per-test copy of the pristine ConfigurationManager."""
+        config_manager = copy.deepcopy(session_config_manager)
+        config_manager.config_file = tmp_path / "config.yaml"
+        config_manager.config_dir = config_manager.config_file.parent
+        return config_manager
+
+    @pytest.fixture(scope="session")
     def sample_config_data(self):
         """Create sample configuration data."""
         return {
@@ -141,9 +166,21 @@ class TestConfigurationManager:
             }
         }
     
-    def test_initialization_with_default_config(self, temp_dir):
+    @pytest.fixture(scope="session")
+    def sample_config_yaml_bytes(self, sample_config_data):
+        """Serialize the sample configuration to YAML once per session."""
+        return yaml.dump(sample_config_data, default_flow_style=False).encode('utf-8')
+
+    @pytest.fixture(scope="session")
+    def sample_config_json_bytes(self, sample_config_data):
+        """Serialize the sample configuration to JSON once per session."""
+        return json.dumps(
+            sample_config_data, ensure_ascii=False, indent=2
+        ).encode('utf-8')
+
+    def test_initialization_with_default_config(self, tmp_path):
         """Test initialization with default configuration."""
-        config_file = temp_dir / "test_config.yaml"
+        config_file = tmp_path / "test_config.yaml"
         
         config_manager = ConfigurationManager(str(config_file))
         
@@ -156,87 +193,59 @@ class TestConfigurationManager:
         # Check that config file was created
         assert config_file.exists()
     
-    def test_load_configuration_from_yaml(self, temp_dir, sample_config_data):
-        """Test loading configuration from YAML file."""
-        config_file = temp_dir / "test_config.yaml"
-        
-        # Create YAML config file
-        with open(config_file, 'w', encoding='utf-8') as f:
-            yaml.dump(sample_config_data, f, default_flow_style=False)
-        
+    @pytest.mark.parametrize("config_format", ["yaml", "json"])
+    def test_load_configuration(self, tmp_path, sample_config_yaml_bytes,
+                                sample_config_json_bytes, config_format):
+        """Test loading configuration from YAML and JSON files."""
+        config_file = tmp_path / f"test_config.{config_format}"
+
+        # Create config file from the pre-serialized sample data
+        if config_format == "yaml":
+            config_file.write_bytes(sample_config_yaml_bytes)
+        else:
+            config_file.write_bytes(sample_config_json_bytes)
+
         config_manager = ConfigurationManager(str(config_file))
-        
+
         # Verify loaded configuration
         assert len(config_manager.domains) == 2
         assert "monitoring" in config_manager.domains
         assert "reliability" in config_manager.domains
-        
+
         monitoring_config = config_manager.domains["monitoring"]
         assert monitoring_config.name == "Monitoring, Logging, and Remediation"
         assert monitoring_config.target_questions == 44
         assert monitoring_config.weight_percentage == 22.0
-        
+
         assert config_manager.batch_config.batch_size == 10
         assert config_manager.batch_config.strategy == BatchStrategy.SEQUENTIAL
-        
+
         assert len(config_manager.agents) == 2
         assert config_manager.agents["question_generator"].temperature == 0.7
-    
-    def test_load_configuration_from_json(self, temp_dir, sample_config_data):
-        """Test loading configuration from JSON file."""
-        config_file = temp_dir / "test_config.json"
-        
-        # Create JSON config file
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(sample_config_data, f, ensure_ascii=False, indent=2)
-        
-        config_manager = ConfigurationManager(str(config_file))
-        
-        # Verify loaded configuration
-        assert len(config_manager.domains) == 2
-        assert config_manager.batch_config.batch_size == 10
-        assert len(config_manager.agents) == 2
-    
-    def test_save_configuration_yaml(self, temp_dir):
-        """Test saving configuration to YAML file."""
-        config_file = temp_dir / "test_config.yaml"
-        
-        config_manager = ConfigurationManager(str(config_file))
-        config_manager.save_configuration()
-        
-        # Verify file was created and contains valid YAML
-        assert config_file.exists()
-        
-        with open(config_file, 'r', encoding='utf-8') as f:
-            loaded_data = yaml.safe_load(f)
-        
-        assert "domains" in loaded_data
-        assert "batch" in loaded_data
-        assert "agents" in loaded_data
-        assert "saved_at" in loaded_data
-    
-    def test_save_configuration_json(self, temp_dir):
-        """Test saving configuration to JSON file."""
-        config_file = temp_dir / "test_config.json"
-        
+
+    @pytest.mark.parametrize("config_format", ["yaml", "json"])
+    def test_save_configuration(self, tmp_path, config_format):
+        """Test saving configuration to YAML and JSON files."""
+        config_file = tmp_path / f"test_config.{config_format}"
+
         config_manager = ConfigurationManager(str(config_file))
         config_manager.save_configuration()
-        
-        # Verify file was created and contains valid JSON
+
+        # Verify file was created and contains valid data
         assert config_file.exists()
-        
-        with open(config_file, 'r', encoding='utf-8') as f:
-            loaded_data = json.load(f)
-        
+
+        if config_format == "yaml":
+            loaded_data = yaml.safe_load(config_file.read_bytes())
+        else:
+            loaded_data = json.loads(config_file.read_bytes())
+
         assert "domains" in loaded_data
         assert "batch" in loaded_data
         assert "agents" in loaded_data
         assert "saved_at" in loaded_data
     
-    def test_get_domain_config(self, temp_dir):
+    def test_get_domain_config(self, config_manager):
         """Test getting domain configuration."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         # Test existing domain
         monitoring_config = config_manager.get_domain_config("monitoring")
         assert monitoring_config is not None
@@ -246,28 +255,22 @@ class TestConfigurationManager:
         invalid_config = config_manager.get_domain_config("invalid_domain")
         assert invalid_config is None
     
-    def test_update_domain_config(self, temp_dir):
+    def test_update_domain_config(self, config_manager):
         """Test updating domain configuration."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         # Update existing domain
-        config_manager.update_domain_config(
+        monitoring_config = config_manager.update_domain_config(
             "monitoring",
             target_questions=50,
             weight_percentage=25.0
         )
-        
-        monitoring_config = config_manager.get_domain_config("monitoring")
         assert monitoring_config.target_questions == 50
         assert monitoring_config.weight_percentage == 25.0
-        
+
         # Try to update non-existing domain (should not crash)
-        config_manager.update_domain_config("invalid_domain", target_questions=10)
+        assert config_manager.update_domain_config("invalid_domain", target_questions=10) is None
     
-    def test_get_agent_config(self, temp_dir):
+    def test_get_agent_config(self, config_manager):
         """Test getting agent configuration."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         # Test existing agent
         generator_config = config_manager.get_agent_config("question_generator")
         assert generator_config is not None
@@ -277,25 +280,19 @@ class TestConfigurationManager:
         invalid_config = config_manager.get_agent_config("invalid_agent")
         assert invalid_config is None
     
-    def test_update_agent_config(self, temp_dir):
+    def test_update_agent_config(self, config_manager):
         """Test updating agent configuration."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         # Update existing agent
-        config_manager.update_agent_config(
+        generator_config = config_manager.update_agent_config(
             "question_generator",
             temperature=0.8,
             max_tokens=5000
         )
-        
-        generator_config = config_manager.get_agent_config("question_generator")
         assert generator_config.temperature == 0.8
         assert generator_config.max_tokens == 5000
     
-    def test_adjust_batch_size(self, temp_dir):
+    def test_adjust_batch_size(self, config_manager):
         """Test adjusting batch size."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         # Test valid batch size
         config_manager.adjust_batch_size(15)
         assert config_manager.batch_config.batch_size == 15
@@ -310,30 +307,24 @@ class TestConfigurationManager:
         config_manager.adjust_batch_size(0)   # Invalid (<= 0)
         assert config_manager.batch_config.batch_size == original_size
     
-    def test_set_execution_mode(self, temp_dir):
+    def test_set_execution_mode(self, config_manager):
         """Test setting execution mode."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         config_manager.set_execution_mode(ExecutionMode.DEBUG)
         assert config_manager.execution_config.mode == ExecutionMode.DEBUG
         
         config_manager.set_execution_mode(ExecutionMode.MANUAL)
         assert config_manager.execution_config.mode == ExecutionMode.MANUAL
     
-    def test_enable_debug_mode(self, temp_dir):
+    def test_enable_debug_mode(self, config_manager):
         """Test enabling debug mode."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         config_manager.enable_debug_mode()
         
         assert config_manager.execution_config.mode == ExecutionMode.DEBUG
         assert config_manager.monitoring_config.log_level == LogLevel.DEBUG
         assert config_manager.monitoring_config.enable_performance_profiling == True
     
-    def test_adjust_quality_thresholds(self, temp_dir):
+    def test_adjust_quality_thresholds(self, config_manager):
         """Test adjusting quality thresholds."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         config_manager.adjust_quality_thresholds(
             min_technical_accuracy=9.0,
             min_clarity_score=8.5
@@ -342,10 +333,8 @@ class TestConfigurationManager:
         assert config_manager.quality_config.min_technical_accuracy == 9.0
         assert config_manager.quality_config.min_clarity_score == 8.5
     
-    def test_get_runtime_parameters(self, temp_dir):
+    def test_get_runtime_parameters(self, config_manager):
         """Test getting runtime parameters."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         params = config_manager.get_runtime_parameters()
         
         assert "batch_size" in params
@@ -361,31 +350,25 @@ class TestConfigurationManager:
         assert isinstance(params["domain_distribution"], dict)
         assert isinstance(params["agent_settings"], dict)
     
-    def test_validate_configuration_valid(self, temp_dir):
+    def test_validate_configuration_valid(self, config_manager):
         """Test configuration validation with valid configuration."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         is_valid, issues = config_manager.validate_configuration()
         
         assert is_valid
         assert len(issues) == 0
     
-    def test_validate_configuration_invalid_domain_distribution(self, temp_dir):
+    def test_validate_configuration_invalid_domain_distribution(self, config_manager):
         """Test configuration validation with invalid domain distribution."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         # Make domain distribution invalid
         config_manager.domains["monitoring"].target_questions = 100  # Too many
         
         is_valid, issues = config_manager.validate_configuration()
         
         assert not is_valid
-        assert any("Domain distribution totals" in issue for issue in issues)
+        assert "DOMAIN_DIST_MISMATCH" in {issue.code for issue in issues}
     
-    def test_validate_configuration_invalid_agent_settings(self, temp_dir):
+    def test_validate_configuration_invalid_agent_settings(self, config_manager):
         """Test configuration validation with invalid agent settings."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         # Make agent configuration invalid
         config_manager.agents["question_generator"].temperature = 5.0  # Out of range
         config_manager.agents["quality_validator"].max_tokens = -100   # Invalid
@@ -393,13 +376,12 @@ class TestConfigurationManager:
         is_valid, issues = config_manager.validate_configuration()
         
         assert not is_valid
-        assert any("temperature" in issue for issue in issues)
-        assert any("max_tokens must be positive" in issue for issue in issues)
+        issue_codes = {issue.code for issue in issues}
+        assert "AGENT_TEMPERATURE_RANGE" in issue_codes
+        assert "AGENT_MAX_TOKENS_INVALID" in issue_codes
     
-    def test_create_agent_config(self, temp_dir):
+    def test_create_agent_config(self, config_manager):
         """Test creating AgentConfig instance."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         base_config = AgentConfig()
         modified_config = config_manager.create_agent_config(base_config)
         
@@ -412,10 +394,8 @@ class TestConfigurationManager:
         if hasattr(debug_config, 'system_prompt_template'):
             assert "DEBUG MODE" in debug_config.system_prompt_template
     
-    def test_get_configuration_summary(self, temp_dir):
+    def test_get_configuration_summary(self, config_manager):
         """Test getting configuration summary."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
         summary = config_manager.get_configuration_summary()
         
         assert "configuration_file" in summary
@@ -432,33 +412,31 @@ class TestConfigurationManager:
         assert isinstance(summary["domain_summary"], dict)
         assert isinstance(summary["agent_summary"], dict)
     
-    def test_export_configuration(self, temp_dir):
+    def test_export_configuration(self, tmp_path):
         """Test exporting configuration."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        export_path = temp_dir / "exported_config.yaml"
+        config_manager = ConfigurationManager(str(tmp_path / "config.yaml"))
+        export_path = tmp_path / "exported_config.yaml"
         
         config_manager.export_configuration(str(export_path))
         
         assert export_path.exists()
         
         # Verify exported content
-        with open(export_path, 'r', encoding='utf-8') as f:
-            exported_data = yaml.safe_load(f)
-        
+        exported_data = yaml.safe_load(export_path.read_bytes())
+
         assert "domains" in exported_data
         assert "batch" in exported_data
         assert "agents" in exported_data
     
-    def test_import_configuration(self, temp_dir, sample_config_data):
+    def test_import_configuration(self, tmp_path, sample_config_yaml_bytes):
         """Test importing configuration."""
-        # Create source config file
-        source_config = temp_dir / "source_config.yaml"
-        with open(source_config, 'w', encoding='utf-8') as f:
-            yaml.dump(sample_config_data, f, default_flow_style=False)
-        
+        # Create source config file from the pre-serialized sample data
+        source_config = tmp_path / "source_config.yaml"
+        source_config.write_bytes(sample_config_yaml_bytes)
+
         # Create config manager with different file
-        target_config = temp_dir / "target_config.yaml"
-        config_manager = ConfigurationManager(str(target_config))
+        target_config = tmp_path / "target_config.yaml"
+        config_manager = ConfigurationManager(str(target_config), persist_defaults=False)
         
         # Import configuration
         config_manager.import_configuration(str(source_config))
@@ -470,28 +448,44 @@ class TestConfigurationManager:
         # Verify target file was updated
         assert target_config.exists()
     
-    def test_import_nonexistent_configuration(self, temp_dir):
+    def test_import_nonexistent_configuration(self, tmp_path):
         """Test importing from non-existent file."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
+        config_manager = ConfigurationManager(
+            str(tmp_path / "config.yaml"), persist_defaults=False
+        )
+
         with pytest.raises(FileNotFoundError):
-            config_manager.import_configuration(str(temp_dir / "nonexistent.yaml"))
+            config_manager.import_configuration(str(tmp_path / "nonexistent.yaml"))
     
-    @patch('logging.getLogger')
-    def test_logging_integration(self, mock_logger, temp_dir):
-        """Test logging integration."""
-        config_manager = ConfigurationManager(str(temp_dir / "config.yaml"))
-        
-        # Verify logger was created
-        mock_logger.assert_called()
-        
-        # Test that operations trigger logging
-        config_manager.update_domain_config("monitoring", target_questions=50)
-        config_manager.update_agent_config("question_generator", temperature=0.8)
+    def test_logging_integration(self, tmp_path):
+        """Test logging integration.
+
+        Only the module-local "core.configuration_manager" logger is
+        instrumented, so logging elsewhere in the process is untouched.
+        """
+        handler = CollectingHandler()
+        logger = logging.getLogger("core.configuration_manager")
+        logger.addHandler(handler)
+        original_level = logger.level
+        logger.setLevel(logging.INFO)
+
+        try:
+            config_manager = ConfigurationManager(
+                str(tmp_path / "config.yaml"), persist_defaults=False
+            )
+
+            # Test that operations trigger logging
+            config_manager.update_domain_config("monitoring", target_questions=50)
+            config_manager.update_agent_config("question_generator", temperature=0.8)
+
+            assert handler.records
+        finally:
+            logger.removeHandler(handler)
+            logger.setLevel(original_level)
     
-    def test_configuration_persistence(self, temp_dir):
+    def test_configuration_persistence(self, tmp_path):
         """Test that configuration changes persist across instances."""
-        config_file = temp_dir / "persistent_config.yaml"
+        config_file = tmp_path / "persistent_config.yaml"
         
         # Create first instance and modify configuration
         config_manager1 = ConfigurationManager(str(config_file))
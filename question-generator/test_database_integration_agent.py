@@ -7,33 +7,96 @@ JSON structure integrity validation.
 """
 
 import pytest
+import functools
+import hashlib
 import json
-import tempfile
-import shutil
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 from datetime import datetime
 
 # Local imports
 from models import (
     QuestionBatch, Question, LearningResource, IntegrationResult,
-    DatabaseBackup, QuestionDatabase
+    QuestionDatabase
 )
 from core.database_integration_agent import DatabaseIntegrationAgent
-from core.error_handling import QuestionGenerationError, ValidationError
+from core.error_handling import QuestionGenerationError
+
+# Minimal texts satisfying the Question model validators (question requires
+# min_length=50, explanation min_length=100); built once instead of
+# formatting a long f-string per generated question.
+_MIN_QUESTION_TEXT = "Test question padded to the minimum length".ljust(50, "x")
+_MIN_EXPLANATION_TEXT = "Test explanation padded to the minimum length".ljust(100, "x")
+
+# Question ids are formatted dozens of times per test; precompute and
+# intern them once so every lookup shares a single str object.
+_QIDS = [sys.intern(f"q{i:03d}") for i in range(0, 250)]
+
+
+def qid(i):
+    """Return the interned question id string for index ``i``."""
+    return _QIDS[i]
+
+
+@dataclass
+class FakeAgent:
+    """Minimal Strands Agent stand-in exposing only structured_output.
+
+    DatabaseIntegrationAgent only ever calls structured_output, so a plain
+    dataclass avoids Mock's attribute-dispatch machinery on every access.
+    """
+
+    def structured_output(self, model_class, prompt):
+        if model_class is IntegrationResult:
+            return _MOCK_INTEGRATION_RESULT
+        if model_class is QuestionDatabase:
+            return _mock_question_database()
+        return Mock()
+
+
+# Single shared stand-in question; building 200 fresh Mock objects per
+# structured_output call is needlessly expensive.
+_SHARED_MOCK_QUESTION = Mock(spec=[])
+
+# Canned structured-output payloads, built once at import so every
+# structured_output call is a plain lookup.
+_MOCK_INTEGRATION_RESULT = IntegrationResult(
+    success=True,
+    batch_number=1,
+    questions_added=10,
+    new_total_questions=21,
+    added_question_ids=[qid(i) for i in range(12, 22)],
+    updated_metadata={
+        "domains": {"monitoring": 3, "reliability": 13, "deployment": 2, "security": 2, "networking": 1},
+        "difficulty": {"easy": 4, "medium": 15, "hard": 2},
+        "question_types": {"single": 19, "multiple": 2}
+    },
+    validation_passed=True,
+    backup_created=True
+)
+
+@functools.lru_cache(maxsize=1)
+def _mock_question_database():
+    # Built lazily: QuestionDatabase.model_post_init validates question
+    # distributions, so this stub can only be materialized by tests that
+    # actually exercise the final-database branch.
+    return QuestionDatabase.model_construct(
+        total_questions=200,
+        questions=[_SHARED_MOCK_QUESTION] * 200
+    )
 
 
 class TestDatabaseIntegrationAgent:
     """Test cases for Database Integration Agent."""
     
     @pytest.fixture
-    def temp_dir(self):
+    def temp_dir(self, tmp_path_factory, request):
         """Create temporary directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+        return tmp_path_factory.mktemp(request.node.name)
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_database(self):
         """Create sample database data."""
         return {
@@ -59,14 +122,14 @@ class TestDatabaseIntegrationAgent:
             },
             "questions": [
                 {
-                    "id": f"q{i:03d}",
+                    "id": qid(i),
                     "domain": "monitoring",
                     "difficulty": "medium",
                     "type": "single",
-                    "question": f"Test question {i} with sufficient length to meet the minimum character requirement for question validation",
+                    "question": _MIN_QUESTION_TEXT,
                     "options": ["A", "B", "C", "D"],
                     "correct_answer": "A",
-                    "explanation": f"Test explanation {i} with comprehensive details that meet the minimum character requirement for explanation validation. This explanation provides thorough information about the correct answer and why other options are incorrect.",
+                    "explanation": _MIN_EXPLANATION_TEXT,
                     "learning_resources": [],
                     "related_services": ["CloudWatch"],
                     "tags": ["monitoring"]
@@ -75,69 +138,79 @@ class TestDatabaseIntegrationAgent:
             ]
         }
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_question_batch(self):
         """Create sample question batch."""
+        # The literal inputs are already known-valid, so skip Pydantic
+        # validation with model_construct; full validation of these models
+        # is covered by the question generation and validation suites.
         questions = []
         for i in range(1, 11):
-            learning_resource = LearningResource(
+            learning_resource = LearningResource.model_construct(
                 title=f"AWS Documentation {i}",
                 url=f"https://docs.aws.amazon.com/test{i}",
                 type="documentation"
             )
             
-            question = Question(
-                id=f"q{12+i-1:03d}",  # q012 to q021
+            question = Question.model_construct(
+                id=qid(12 + i - 1),  # q012 to q021
                 domain="reliability",
                 difficulty="medium",
                 type="single",
-                question=f"New test question {i} with sufficient length to meet the minimum character requirement for question validation",
+                question=_MIN_QUESTION_TEXT,
                 options=["A", "B", "C", "D"],
                 correct_answer="B",
-                explanation=f"New test explanation {i} with comprehensive details that meet the minimum character requirement for explanation validation. This explanation provides thorough information about the correct answer and why other options are incorrect.",
+                explanation=_MIN_EXPLANATION_TEXT,
                 learning_resources=[learning_resource],
                 related_services=["EC2", "RDS"],
                 tags=["reliability", "backup"]
             )
             questions.append(question)
         
-        return QuestionBatch(
+        return QuestionBatch.model_construct(
             batch_number=1,
             questions=questions,
             batch_metadata={"generated_at": datetime.now().isoformat()}
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
+    def sample_database_bytes(self, sample_database):
+        """Serialize the sample database to JSON once per session."""
+        return json.dumps(sample_database, ensure_ascii=False, indent=2).encode('utf-8')
+
+    @pytest.fixture(scope="session")
+    def db_missing_total(self, sample_database):
+        """Sample database without the required total_questions field."""
+        return {k: v for k, v in sample_database.items() if k != "total_questions"}
+
+    @pytest.fixture(scope="session")
+    def db_count_mismatch(self, sample_database):
+        """Sample database whose total_questions disagrees with the questions list."""
+        return {**sample_database, "total_questions": 999}
+
+    @pytest.fixture(scope="session")
+    def modified_database_bytes(self, db_count_mismatch):
+        """Serialized database variant used to verify backup restoration."""
+        return json.dumps(db_count_mismatch, ensure_ascii=False).encode('utf-8')
+
+    @pytest.fixture(scope="session")
+    def minimal_database(self):
+        """Smallest database payload for tests that only assert backup metadata."""
+        return {
+            "version": "2.0.0",
+            "total_questions": 1,
+            "questions": [{"id": "q001"}]
+        }
+
+    @pytest.fixture(scope="session")
+    def minimal_database_bytes(self, minimal_database):
+        """Serialize the minimal database to JSON once per session."""
+        return json.dumps(minimal_database, ensure_ascii=False).encode('utf-8')
+
+    @pytest.fixture(scope="session")
     def mock_agent(self):
-        """Create mock Strands Agent."""
-        agent = Mock()
-        
-        # Mock structured_output method
-        def mock_structured_output(model_class, prompt):
-            if model_class == IntegrationResult:
-                return IntegrationResult(
-                    success=True,
-                    batch_number=1,
-                    questions_added=10,
-                    new_total_questions=21,
-                    added_question_ids=[f"q{i:03d}" for i in range(12, 22)],
-                    updated_metadata={
-                        "domains": {"monitoring": 3, "reliability": 13, "deployment": 2, "security": 2, "networking": 1},
-                        "difficulty": {"easy": 4, "medium": 15, "hard": 2},
-                        "question_types": {"single": 19, "multiple": 2}
-                    },
-                    validation_passed=True,
-                    backup_created=True
-                )
-            elif model_class == QuestionDatabase:
-                return QuestionDatabase(
-                    total_questions=200,
-                    questions=[Mock() for _ in range(200)]  # Mock questions
-                )
-            return Mock()
-        
-        agent.structured_output = mock_structured_output
-        return agent
+        """Create a fake Strands Agent returning the canned payloads."""
+        return FakeAgent()
     
     @pytest.fixture
     def db_integration_agent(self, temp_dir, mock_agent):
@@ -151,6 +224,19 @@ class TestDatabaseIntegrationAgent:
             backup_dir=str(backup_dir)
         )
     
+    @pytest.fixture
+    def seeded_agent(self, temp_dir, mock_agent, sample_database_bytes):
+        """Create an agent whose database is already seeded with sample data."""
+        database_path = temp_dir / "questions.json"
+        database_path.write_bytes(sample_database_bytes)
+        
+        agent = DatabaseIntegrationAgent(
+            agent=mock_agent,
+            database_path=str(database_path),
+            backup_dir=str(temp_dir / "backups")
+        )
+        return agent, database_path
+
     def test_initialization(self, temp_dir, mock_agent):
         """Test Database Integration Agent initialization."""
         database_path = temp_dir / "questions.json"
@@ -166,19 +252,18 @@ class TestDatabaseIntegrationAgent:
         assert agent.backup_dir == backup_dir
         assert backup_dir.exists()  # Should be created automatically
     
-    def test_create_backup(self, db_integration_agent, sample_database, temp_dir):
+    def test_create_backup(self, db_integration_agent, minimal_database, minimal_database_bytes, temp_dir):
         """Test backup creation functionality."""
         # Create initial database file
         database_path = temp_dir / "questions.json"
-        with open(database_path, 'w', encoding='utf-8') as f:
-            json.dump(sample_database, f, ensure_ascii=False, indent=2)
+        database_path.write_bytes(minimal_database_bytes)
         
         # Create backup
         backup_info = db_integration_agent.create_backup(batch_number=1)
         
         assert backup_info.backup_id.startswith("questions_backup_")
         assert backup_info.backup_id.endswith("_batch01")
-        assert backup_info.questions_count == 11
+        assert backup_info.questions_count == 1
         assert backup_info.created_before_batch == 1
         assert backup_info.checksum is not None
         
@@ -189,63 +274,50 @@ class TestDatabaseIntegrationAgent:
         # Verify backup content
         with open(backup_path, 'r', encoding='utf-8') as f:
             backup_data = json.load(f)
-        assert backup_data == sample_database
+        assert backup_data == minimal_database
     
-    def test_validate_json_structure(self, db_integration_agent, sample_database):
+    @pytest.mark.parametrize("db_fixture,expect_valid,expect_msg", [
+        ("sample_database", True, None),
+        ("db_missing_total", False, "Missing required field: total_questions"),
+        ("db_count_mismatch", False, "Question count mismatch"),
+    ])
+    def test_validate_json_structure(self, db_integration_agent, request,
+                                     db_fixture, expect_valid, expect_msg):
         """Test JSON structure validation."""
-        # Test valid structure
-        is_valid, issues = db_integration_agent.validate_json_structure(sample_database)
-        assert is_valid
-        assert len(issues) == 0
-        
-        # Test invalid structure - missing required field
-        invalid_data = sample_database.copy()
-        del invalid_data['total_questions']
-        
-        is_valid, issues = db_integration_agent.validate_json_structure(invalid_data)
-        assert not is_valid
-        assert any("Missing required field: total_questions" in issue for issue in issues)
-        
-        # Test invalid structure - question count mismatch
-        invalid_data = sample_database.copy()
-        invalid_data['total_questions'] = 999
-        
-        is_valid, issues = db_integration_agent.validate_json_structure(invalid_data)
-        assert not is_valid
-        assert any("Question count mismatch" in issue for issue in issues)
-    
-    def test_validate_id_continuity(self, db_integration_agent):
-        """Test question ID continuity validation."""
-        # Test valid ID sequence
-        questions = [{"id": f"q{i:03d}"} for i in range(1, 6)]
-        is_valid, issues = db_integration_agent.validate_id_continuity(questions)
-        assert is_valid
-        assert len(issues) == 0
+        data = request.getfixturevalue(db_fixture)
         
-        # Test invalid ID sequence - gap
-        questions = [{"id": "q001"}, {"id": "q002"}, {"id": "q004"}]  # Missing q003
-        is_valid, issues = db_integration_agent.validate_id_continuity(questions)
-        assert not is_valid
-        assert any("ID mismatch" in issue for issue in issues)
+        is_valid, issues = db_integration_agent.validate_json_structure(data)
         
-        # Test duplicate IDs
-        questions = [{"id": "q001"}, {"id": "q002"}, {"id": "q001"}]
+        assert is_valid == expect_valid
+        if expect_msg is None:
+            assert len(issues) == 0
+        else:
+            assert any(expect_msg in issue for issue in issues)
+    
+    @pytest.mark.parametrize("questions,expect_valid,expect_msg", [
+        # Valid ID sequence
+        ([{"id": qid(i)} for i in range(1, 6)], True, None),
+        # Gap in the sequence (missing q003)
+        ([{"id": "q001"}, {"id": "q002"}, {"id": "q004"}], False, "ID mismatch"),
+        # Duplicate IDs
+        ([{"id": "q001"}, {"id": "q002"}, {"id": "q001"}], False, "Duplicate question IDs"),
+        # Missing ID in second question
+        ([{"id": "q001"}, {}, {"id": "q003"}], False, "Questions missing IDs"),
+    ])
+    def test_validate_id_continuity(self, db_integration_agent, questions,
+                                    expect_valid, expect_msg):
+        """Test question ID continuity validation."""
         is_valid, issues = db_integration_agent.validate_id_continuity(questions)
-        assert not is_valid
-        assert any("Duplicate question IDs" in issue for issue in issues)
         
-        # Test missing IDs
-        questions = [{"id": "q001"}, {}, {"id": "q003"}]  # Missing ID in second question
-        is_valid, issues = db_integration_agent.validate_id_continuity(questions)
-        assert not is_valid
-        assert any("Questions missing IDs" in issue for issue in issues)
+        assert is_valid == expect_valid
+        if expect_msg is None:
+            assert len(issues) == 0
+        else:
+            assert any(expect_msg in issue for issue in issues)
     
-    def test_integrate_batch_success(self, db_integration_agent, sample_database, sample_question_batch, temp_dir):
+    def test_integrate_batch_success(self, seeded_agent, sample_question_batch):
         """Test successful batch integration."""
-        # Create initial database file
-        database_path = temp_dir / "questions.json"
-        with open(database_path, 'w', encoding='utf-8') as f:
-            json.dump(sample_database, f, ensure_ascii=False, indent=2)
+        db_integration_agent, database_path = seeded_agent
         
         # Integrate batch
         result = db_integration_agent.integrate_batch_with_structured_output(
@@ -271,7 +343,7 @@ class TestDatabaseIntegrationAgent:
         
         # Verify ID continuity
         question_ids = [q['id'] for q in updated_data['questions']]
-        expected_ids = [f'q{i:03d}' for i in range(1, 22)]
+        expected_ids = [qid(i) for i in range(1, 22)]
         assert question_ids == expected_ids
     
     def test_integrate_batch_with_empty_database(self, db_integration_agent, sample_question_batch, temp_dir):
@@ -297,20 +369,15 @@ class TestDatabaseIntegrationAgent:
         assert data['total_questions'] == 10
         assert len(data['questions']) == 10
     
-    def test_restore_from_backup(self, db_integration_agent, sample_database, temp_dir):
+    def test_restore_from_backup(self, seeded_agent, sample_database, modified_database_bytes):
         """Test backup restoration functionality."""
         # Create initial database and backup
-        database_path = temp_dir / "questions.json"
-        with open(database_path, 'w', encoding='utf-8') as f:
-            json.dump(sample_database, f, ensure_ascii=False, indent=2)
+        db_integration_agent, database_path = seeded_agent
         
         backup_info = db_integration_agent.create_backup()
         
         # Modify database
-        modified_data = sample_database.copy()
-        modified_data['total_questions'] = 999
-        with open(database_path, 'w', encoding='utf-8') as f:
-            json.dump(modified_data, f, ensure_ascii=False, indent=2)
+        database_path.write_bytes(modified_database_bytes)
         
         # Restore from backup
         success = db_integration_agent.restore_from_backup(backup_info.backup_id)
@@ -322,12 +389,11 @@ class TestDatabaseIntegrationAgent:
         
         assert restored_data == sample_database
     
-    def test_list_backups(self, db_integration_agent, sample_database, temp_dir):
+    def test_list_backups(self, db_integration_agent, minimal_database_bytes, temp_dir):
         """Test backup listing functionality."""
         # Create database and multiple backups
         database_path = temp_dir / "questions.json"
-        with open(database_path, 'w', encoding='utf-8') as f:
-            json.dump(sample_database, f, ensure_ascii=False, indent=2)
+        database_path.write_bytes(minimal_database_bytes)
         
         backup1 = db_integration_agent.create_backup(batch_number=1)
         backup2 = db_integration_agent.create_backup(batch_number=2)
@@ -342,7 +408,7 @@ class TestDatabaseIntegrationAgent:
         
         # Verify backup info
         for backup in backups:
-            assert backup.questions_count == 11
+            assert backup.questions_count == 1
             assert backup.backup_size_bytes > 0
             assert backup.checksum is not None
     
@@ -352,12 +418,11 @@ class TestDatabaseIntegrationAgent:
         complete_data = {
             "version": "2.0.0",
             "total_questions": 200,
-            "questions": [{"id": f"q{i:03d}"} for i in range(1, 201)]
+            "questions": [{"id": qid(i)} for i in range(1, 201)]
         }
         
         database_path = temp_dir / "questions.json"
-        with open(database_path, 'w', encoding='utf-8') as f:
-            json.dump(complete_data, f, ensure_ascii=False, indent=2)
+        database_path.write_bytes(json.dumps(complete_data, ensure_ascii=False).encode('utf-8'))
         
         # Create mock integration results
         integration_results = [
@@ -380,12 +445,17 @@ class TestDatabaseIntegrationAgent:
         assert isinstance(final_db, QuestionDatabase)
         assert final_db.total_questions == 200
     
-    def test_validate_database_integrity(self, db_integration_agent, sample_database, temp_dir):
-        """Test comprehensive database integrity validation."""
-        # Create valid database
+    def test_checksum_matches_direct_sha256(self, db_integration_agent, minimal_database_bytes, temp_dir):
+        """Streaming checksum helper matches a direct SHA-256 of the bytes."""
         database_path = temp_dir / "questions.json"
-        with open(database_path, 'w', encoding='utf-8') as f:
-            json.dump(sample_database, f, ensure_ascii=False, indent=2)
+        database_path.write_bytes(minimal_database_bytes)
+        
+        expected = hashlib.sha256(minimal_database_bytes).hexdigest()
+        assert db_integration_agent._calculate_checksum(database_path) == expected
+    
+    def test_validate_database_integrity(self, seeded_agent):
+        """Test comprehensive database integrity validation."""
+        db_integration_agent, _ = seeded_agent
         
         is_valid, issues, report = db_integration_agent.validate_database_integrity()
         
@@ -409,19 +479,25 @@ class TestDatabaseIntegrationAgent:
         success = db_integration_agent.restore_from_backup("non_existent_backup")
         assert not success
     
-    @patch('shutil.copy2')
-    def test_backup_creation_failure(self, mock_copy, db_integration_agent, sample_database, temp_dir):
+    def test_backup_creation_failure(self, mock_agent, sample_database_bytes, temp_dir):
         """Test backup creation failure handling."""
         # Create database file
         database_path = temp_dir / "questions.json"
-        with open(database_path, 'w', encoding='utf-8') as f:
-            json.dump(sample_database, f, ensure_ascii=False, indent=2)
+        database_path.write_bytes(sample_database_bytes)
         
-        # Mock copy failure
-        mock_copy.side_effect = Exception("Copy failed")
+        # Inject a copier that always fails
+        def failing_copier(*args, **kwargs):
+            raise Exception("Copy failed")
+        
+        agent = DatabaseIntegrationAgent(
+            agent=mock_agent,
+            database_path=str(database_path),
+            backup_dir=str(temp_dir / "backups"),
+            copier=failing_copier
+        )
         
         with pytest.raises(QuestionGenerationError, match="Failed to create backup"):
-            db_integration_agent.create_backup()
+            agent.create_backup()
     
     def test_integration_with_validation_failure(self, db_integration_agent, sample_question_batch, temp_dir):
         """Test integration behavior when validation fails."""
@@ -433,8 +509,7 @@ class TestDatabaseIntegrationAgent:
         }
         
         database_path = temp_dir / "questions.json"
-        with open(database_path, 'w', encoding='utf-8') as f:
-            json.dump(invalid_data, f, ensure_ascii=False, indent=2)
+        database_path.write_bytes(json.dumps(invalid_data, ensure_ascii=False).encode('utf-8'))
         
         # Mock the agent to return success but the validation will fail
         result = db_integration_agent.integrate_batch_with_structured_output(
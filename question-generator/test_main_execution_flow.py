@@ -7,9 +7,8 @@ orchestration, batch processing, progress tracking, and error recovery.
 
 import pytest
 import json
-import tempfile
-import shutil
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime, timedelta
 
@@ -18,84 +17,112 @@ from core.main_execution_flow import (
     MainExecutionFlow, FlowStatus, BatchStatus, 
     BatchProgress, FlowProgress
 )
-from core.configuration_manager import ConfigurationManager
 from config import AgentConfig
-from models import (
-    ExamGuideAnalysis, DomainAnalysis, QuestionBatch, 
-    Question, LearningResource, IntegrationResult
-)
 
 
 class TestMainExecutionFlow:
     """Test cases for Main Execution Flow."""
     
     @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+    def temp_dir(self, tmp_path):
+        """Temporary directory for testing, cleaned up lazily by pytest."""
+        return tmp_path
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def mock_agent_config(self):
-        """Create mock agent configuration."""
-        config = Mock(spec=AgentConfig)
-        config.log_level = "INFO"
-        config.system_prompt_template = "You are {role}. Context: {context}. Requirements: {requirements}"
-        return config
-    
-    @pytest.fixture
+        """Create a stub agent configuration.
+
+        A SimpleNamespace carries the two attributes the flow reads without
+        the spec introspection cost of Mock(spec=AgentConfig).
+        """
+        return SimpleNamespace(
+            log_level="INFO",
+            system_prompt_template="You are {role}. Context: {context}. Requirements: {requirements}"
+        )
+
+    @pytest.fixture(scope="session")
     def sample_exam_analysis(self):
         """Create sample exam guide analysis."""
+        # Imported here so tests that never touch the analysis models
+        # (e.g. the enum tests under -k enum) skip pydantic model setup
+        from models import ExamGuideAnalysis, DomainAnalysis
+
         domains = [
             DomainAnalysis(
-                name="Monitoring, Logging, and Remediation",
-                weight_percentage=22.0,
+                domain="monitoring",
+                domain_name="Monitoring, Logging, and Remediation",
+                weight=22.0,
                 target_questions=44,
                 tasks=[],
-                skills=[],
-                related_services=["CloudWatch", "CloudTrail"]
+                key_services=["CloudWatch", "CloudTrail"],
+                complexity_level="intermediate"
             ),
             DomainAnalysis(
-                name="Reliability and Business Continuity", 
-                weight_percentage=22.0,
+                domain="reliability",
+                domain_name="Reliability and Business Continuity",
+                weight=22.0,
                 target_questions=44,
                 tasks=[],
-                skills=[],
-                related_services=["Backup", "RDS"]
+                key_services=["Backup", "RDS"],
+                complexity_level="intermediate"
             )
         ]
-        
+
         return ExamGuideAnalysis(
             exam_title="AWS Certified CloudOps Engineer - Associate",
             exam_code="SOA-C03",
-            target_total_questions=200,
-            existing_questions=11,
-            questions_to_generate=189,
-            domains=domains,
-            overall_difficulty_distribution={"easy": 60, "medium": 100, "hard": 40},
-            question_type_distribution={"single": 160, "multiple": 40}
+            total_questions=200,
+            domains=domains
         )
     
-    @pytest.fixture
-    def execution_flow(self, temp_dir, mock_agent_config):
-        """Create MainExecutionFlow instance for testing."""
-        database_path = temp_dir / "questions.json"
-        backup_dir = temp_dir / "backups"
-        state_file = temp_dir / "state.json"
-        
-        # Create logs directory
-        logs_dir = temp_dir / "logs"
-        logs_dir.mkdir(exist_ok=True)
-        
-        flow = MainExecutionFlow(
+    @pytest.fixture(scope="session")
+    def session_execution_flow(self, tmp_path_factory, mock_agent_config):
+        """Construct MainExecutionFlow once per session.
+
+        Construction pays for logger setup and AgentFactory initialization,
+        so it runs once; per-test isolation is handled by execution_flow.
+        """
+        base_dir = tmp_path_factory.mktemp("execution_flow")
+        (base_dir / "logs").mkdir(exist_ok=True)
+
+        return MainExecutionFlow(
             config=mock_agent_config,
-            database_path=str(database_path),
-            backup_dir=str(backup_dir),
-            state_file=str(state_file),
+            database_path=str(base_dir / "questions.json"),
+            backup_dir=str(base_dir / "backups"),
+            state_file=str(base_dir / "state.json"),
             log_level="DEBUG"
         )
-        
+
+    @pytest.fixture(autouse=True, scope="session")
+    def mock_db_integration_agent(self):
+        """Patch the db_integration_agent property once for the class.
+
+        Re-entering patch.object per test rebuilds the mock machinery each
+        time; flow tests only ever interact with the mock, so one patch
+        covers the class and tests configure attributes on it.
+        """
+        mock_agent = Mock()
+        with patch.object(MainExecutionFlow, 'db_integration_agent', new=mock_agent):
+            yield mock_agent
+
+    @pytest.fixture
+    def execution_flow(self, session_execution_flow, temp_dir):
+        """Provide the shared flow repointed at this test's directories."""
+        flow = session_execution_flow
+        flow.database_path = temp_dir / "questions.json"
+        flow.backup_dir = temp_dir / "backups"
+        flow.backup_dir.mkdir(exist_ok=True)
+        flow.state_file = temp_dir / "state.json"
+
+        # Undo per-test mutations from earlier tests; cached_property
+        # agents live in the instance dict under their accessor names
+        flow.reset_progress()
+        for agent_name in ('exam_analyzer', 'batch_manager', 'aws_knowledge_agent',
+                           'question_generator', 'quality_validator',
+                           'db_integration_agent', 'workflow_agent'):
+            flow.__dict__.pop(agent_name, None)
+        flow.__dict__.pop('exam_analysis', None)
+
         return flow
     
     def test_initialization(self, execution_flow, temp_dir):
@@ -241,6 +268,8 @@ class TestMainExecutionFlow:
     @patch('core.main_execution_flow.MainExecutionFlow._execute_batch_steps')
     async def test_process_batch_with_workflow_success(self, mock_execute_steps, execution_flow, sample_exam_analysis):
         """Test successful batch processing."""
+        from models import IntegrationResult
+
         # Mock the batch execution
         mock_integration_result = IntegrationResult(
             success=True,
@@ -317,10 +346,10 @@ class TestMainExecutionFlow:
     
     def test_lazy_agent_initialization(self, execution_flow):
         """Test lazy initialization of agents."""
-        # Initially agents should be None
-        assert execution_flow._exam_analyzer is None
-        assert execution_flow._batch_manager is None
-        assert execution_flow._question_generator is None
+        # Initially no agents should be cached
+        assert 'exam_analyzer' not in execution_flow.__dict__
+        assert 'batch_manager' not in execution_flow.__dict__
+        assert 'question_generator' not in execution_flow.__dict__
         
         # Access agents to trigger initialization
         with patch.object(execution_flow.agent_factory, 'create_exam_guide_analyzer') as mock_create:
@@ -329,7 +358,7 @@ class TestMainExecutionFlow:
             
             agent = execution_flow.exam_analyzer
             assert agent == mock_agent
-            assert execution_flow._exam_analyzer == mock_agent
+            assert execution_flow.__dict__['exam_analyzer'] == mock_agent
             mock_create.assert_called_once()
             
             # Second access should not create new agent
@@ -339,8 +368,10 @@ class TestMainExecutionFlow:
     
     @patch('core.main_execution_flow.MainExecutionFlow.initialize_flow')
     @patch('core.main_execution_flow.MainExecutionFlow.process_batch_with_workflow')
-    async def test_run_complete_flow_success(self, mock_process_batch, mock_initialize, execution_flow, sample_exam_analysis):
+    async def test_run_complete_flow_success(self, mock_process_batch, mock_initialize, execution_flow, sample_exam_analysis, mock_db_integration_agent):
         """Test successful complete flow execution."""
+        from models import IntegrationResult
+
         # Mock initialization
         mock_initialize.return_value = sample_exam_analysis
         
@@ -355,20 +386,19 @@ class TestMainExecutionFlow:
         )
         mock_process_batch.return_value = mock_integration_result
         
-        # Mock database integration agent
-        with patch.object(execution_flow, 'db_integration_agent') as mock_db_agent:
-            mock_final_db = Mock()
-            mock_final_db.total_questions = 200
-            mock_db_agent.create_final_database_with_structured_output.return_value = mock_final_db
-            
-            result = await execution_flow.run_complete_flow()
-            
-            assert result == mock_final_db
-            assert execution_flow.progress.status == FlowStatus.COMPLETED
-            assert execution_flow.progress.end_time is not None
-            
-            # Verify all batches were processed
-            assert mock_process_batch.call_count == 19
+        # Configure the class-level database integration mock
+        mock_final_db = Mock()
+        mock_final_db.total_questions = 200
+        mock_db_integration_agent.create_final_database_with_structured_output.return_value = mock_final_db
+
+        result = await execution_flow.run_complete_flow()
+
+        assert result == mock_final_db
+        assert execution_flow.progress.status == FlowStatus.COMPLETED
+        assert execution_flow.progress.end_time is not None
+
+        # Verify all batches were processed
+        assert mock_process_batch.call_count == 19
     
     @patch('core.main_execution_flow.MainExecutionFlow.initialize_flow')
     async def test_run_complete_flow_with_pause(self, mock_initialize, execution_flow, sample_exam_analysis):
@@ -386,7 +416,7 @@ class TestMainExecutionFlow:
     
     @patch('core.main_execution_flow.MainExecutionFlow.load_state')
     @patch('core.main_execution_flow.MainExecutionFlow.process_batch_with_workflow')
-    async def test_run_complete_flow_recovery_mode(self, mock_process_batch, mock_load_state, execution_flow, sample_exam_analysis):
+    async def test_run_complete_flow_recovery_mode(self, mock_process_batch, mock_load_state, execution_flow, sample_exam_analysis, mock_db_integration_agent):
         """Test complete flow execution in recovery mode."""
         # Mock state loading
         mock_load_state.return_value = True
@@ -398,6 +428,7 @@ class TestMainExecutionFlow:
         execution_flow.progress.batch_progress[2].status = BatchStatus.COMPLETED
         
         # Mock batch processing for remaining batches
+        from models import IntegrationResult
         mock_integration_result = IntegrationResult(
             success=True,
             batch_number=3,
@@ -408,21 +439,20 @@ class TestMainExecutionFlow:
         )
         mock_process_batch.return_value = mock_integration_result
         
-        # Mock database integration agent
-        with patch.object(execution_flow, 'db_integration_agent') as mock_db_agent:
-            mock_final_db = Mock()
-            mock_final_db.total_questions = 200
-            mock_db_agent.create_final_database_with_structured_output.return_value = mock_final_db
-            
-            # Need to set exam_analysis for recovery mode
-            execution_flow.exam_analysis = sample_exam_analysis
-            
-            result = await execution_flow.run_complete_flow()
-            
-            assert result == mock_final_db
-            
-            # Should skip completed batches (1, 2) and process remaining (3-19)
-            assert mock_process_batch.call_count == 17
+        # Configure the class-level database integration mock
+        mock_final_db = Mock()
+        mock_final_db.total_questions = 200
+        mock_db_integration_agent.create_final_database_with_structured_output.return_value = mock_final_db
+
+        # Need to set exam_analysis for recovery mode
+        execution_flow.exam_analysis = sample_exam_analysis
+
+        result = await execution_flow.run_complete_flow()
+
+        assert result == mock_final_db
+
+        # Should skip completed batches (1, 2) and process remaining (3-19)
+        assert mock_process_batch.call_count == 17
     
     @patch('core.main_execution_flow.MainExecutionFlow.initialize_flow')
     async def test_run_complete_flow_failure(self, mock_initialize, execution_flow):